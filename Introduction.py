@@ -1,28 +1,20 @@
 import streamlit as st
 import os
-import base64
+from utils.images import image_derivative
+from utils.static_assets import media_src
 
 st.set_page_config(page_title="Intro Page", layout="wide", initial_sidebar_state="collapsed")
 
-# === Helper để chuyển ảnh sang base64 ===
-def get_base64_of_bin_file(bin_file):
-    try:
-        with open(bin_file, 'rb') as f:
-            data = f.read()
-        return base64.b64encode(data).decode()
-    except Exception:
-        return None
+# === Set background image (static URL, or base64 when not published) ===
+bg_image_path = image_derivative("image/background_intropage.jpg")
+bg_src = media_src(bg_image_path)
 
-# === Set background image as base64 ===
-bg_image_path = "image/background_intropage.jpg"
-bg_base64 = get_base64_of_bin_file(bg_image_path)
-
-if bg_base64:
+if bg_src:
     bg_overlay = f"""
     <style>
     .stApp {{
         background: linear-gradient(rgba(0,0,0,0.75), rgba(0,0,0,0.75)),
-                    url("data:image/jpg;base64,{bg_base64}");
+                    url("{bg_src}");
         background-size: cover;
         background-attachment: fixed;
         background-position: center;
@@ -58,10 +50,10 @@ else:
 
 # === Video background (optional) ===
 video_path = os.path.join("image", "intro_video.mp4")
-video_base64 = get_base64_of_bin_file(video_path)
-video_base64_string = f"data:video/mp4;base64,{video_base64}" if video_base64 else None
+# Served with HTTP range support when published to static/
+video_src = media_src(video_path)
 
-if video_base64_string:
+if video_src:
     video_html = f"""
     <style>
     .full-width-video {{
@@ -81,7 +73,7 @@ if video_base64_string:
     </style>
     <div class="full-width-video fade-in">
         <video autoplay muted loop playsinline>
-            <source src="{video_base64_string}" type="video/mp4">
+            <source src="{video_src}" type="video/mp4">
             Your browser does not support the video tag.
         </video>
     </div>
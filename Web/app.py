@@ -3,18 +3,34 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-import squarify
 import numpy as np
+import sys
+from pathlib import Path
 
-# Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv("Billionaires_Statistics_Dataset.csv")
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.dataset import dataset_path, dataset_version
+
+# Load data: shared by every session and keyed by the dataset version, so reruns neither hash nor copy it
+@st.cache_resource(show_spinner=False)
+def load_data(data_version):
+    df = pd.read_csv(dataset_path())
     df = df.dropna(subset=["industries", "finalWorth", "country", "personName"])
+    df["selfMadeLabel"] = df["selfMade"].map({True: "Self-made", False: "Not Self-made"})
     return df
 
-df = load_data()
+# Category counts for every (gender, self-made) pair, so treemap filters only sum a few rows
+@st.cache_resource(show_spinner=False)
+def load_category_counts(_df, data_version):
+    return (
+        _df.dropna(subset=["gender", "selfMadeLabel", "category"])
+        .groupby(["gender", "selfMadeLabel", "category"])
+        .size()
+        .rename("count")
+        .reset_index()
+    )
+
+data_version = dataset_version()
+df = load_data(data_version)
 
 st.set_page_config(page_title="Global Billionaires Dashboard", layout="wide")
 st.title("💰 Global Billionaires Analysis Dashboard")
@@ -96,16 +112,26 @@ st.plotly_chart(fig_donut, use_container_width=True)
 
 # Treemap
 st.subheader("🌲 Industry Treemap (Filtered by Gender and Self-made Status)")
-df["selfMadeLabel"] = df["selfMade"].map({True: "Self-made", False: "Not Self-made"})
+category_counts = load_category_counts(df, data_version)
 gender_options = sorted(df["gender"].dropna().unique())
 selected_genders = st.multiselect("Select Genders:", gender_options, default=gender_options)
 selected_selfmade = st.multiselect("Select Wealth Type:", ["Self-made", "Not Self-made"], default=["Self-made", "Not Self-made"])
-tree_df = df[df["gender"].isin(selected_genders) & df["selfMadeLabel"].isin(selected_selfmade)]
-cat_count = tree_df["category"].value_counts().reset_index()
-cat_count.columns = ["category", "count"]
-cat_count["label"] = cat_count["category"] + ": " + cat_count["count"].astype(str)
-
-fig_tree, ax = plt.subplots(figsize=(12, 6))
-squarify.plot(sizes=cat_count["count"], label=cat_count["label"], alpha=0.8, ax=ax)
-plt.axis("off")
-st.pyplot(fig_tree)
+cat_count = (
+    category_counts[category_counts["gender"].isin(selected_genders) & category_counts["selfMadeLabel"].isin(selected_selfmade)]
+    .groupby("category")["count"]
+    .sum()
+    .sort_values(ascending=False)
+    .reset_index()
+)
+
+# Rendered by Plotly in the browser instead of rasterizing a matplotlib figure on every rerun
+if cat_count.empty:
+    st.info("No billionaires match the selected filters.")
+else:
+    fig_tree = px.treemap(cat_count, path=["category"], values="count")
+    fig_tree.update_traces(
+        texttemplate="%{label}<br>%{value}",
+        hovertemplate="<b>%{label}</b><br>Billionaires: %{value}<extra></extra>"
+    )
+    fig_tree.update_layout(margin=dict(t=10, l=0, r=0, b=0), height=500)
+    st.plotly_chart(fig_tree, use_container_width=True)
@@ -1,5 +1,12 @@
 import streamlit as st
 import pandas as pd
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.dataset import dataset_path, dataset_version
+from utils.store import resolve
+from utils.table import filter_rows, render_paginated_table
 
 # === Page Configuration ===
 st.set_page_config(page_title="Billionaire Wealth Dashboard", layout="wide")
@@ -57,7 +64,7 @@ st.markdown("## III. 👤 Dataset Author")
 with st.container():
     col1, col2 = st.columns([1, 3])
     with col1:
-        st.image("nidula_profile.jpg", caption="Nidula Elgiriyewithana", width=220)
+        st.image(str(resolve("image/nidula_profile.jpg")), caption="Nidula Elgiriyewithana", width=220)
     with col2:
         st.markdown("""
 **Nidula Elgiriyewithana** is a passionate and results-driven Data Scientist  
@@ -74,8 +81,15 @@ he is deeply fascinated by the potential of data to transform industries and dri
         """)
 
 # === IV. Load Dataset ===
-df = pd.read_csv("Billionaires_Statistics_Dataset.csv")
-df = df.dropna(subset=['personName', 'finalWorth', 'country', 'industries'])
+# Shared across sessions and keyed by the dataset version; the page treats the frame as read-only
+@st.cache_resource(show_spinner=False)
+def load_data(csv_path, data_version):
+    df = pd.read_csv(csv_path)
+    return df.dropna(subset=['personName', 'finalWorth', 'country', 'industries']).reset_index(drop=True)
+
+csv_path = dataset_path()
+data_version = dataset_version(csv_path)
+df = load_data(csv_path, data_version)
 
 # === V. Filtered Table ===
 st.markdown("## IV. 📄 Full Dataset Table with Filters")
@@ -99,14 +113,14 @@ selected_worth = col3.slider(
 )
 
 if selected_countries and selected_industries:
-    filtered_df = df[
+    filtered_rows = filter_rows(
         (df['country'].isin(selected_countries)) &
         (df['industries'].isin(selected_industries)) &
         (df['finalWorth'] >= selected_worth[0]) &
         (df['finalWorth'] <= selected_worth[1])
-    ]
-    st.markdown(f"✅ **Filtered Records:** `{filtered_df.shape[0]}` billionaire(s)")
-    st.dataframe(filtered_df)
+    )
+    st.markdown(f"✅ **Filtered Records:** `{len(filtered_rows)}` billionaire(s)")
+    render_paginated_table(df, filtered_rows, data_version, "Web/dataset.py", key="dataset_table")
 else:
     st.warning("Please select at least one country **and** one industry to view filtered data.")
 
@@ -1,9 +1,14 @@
 import streamlit as st
-import os
 from PIL import Image
 from streamlit_extras.colored_header import colored_header
 from streamlit_extras.let_it_rain import rain
-import base64
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.base64_cache import get_base64_cache
+from utils.images import image_derivative, image_mime
+from utils.store import resolve
 
 # === Page settings ===
 st.set_page_config(page_title="Business IT 2 — Python Project", page_icon="💰", layout="wide")
@@ -37,20 +42,21 @@ st.markdown("""
 
 # === Helper functions ===
 def base64_image(image_path):
-    with open(image_path, "rb") as img_file:
-        b64_string = base64.b64encode(img_file.read()).decode()
-    return b64_string
+    return get_base64_cache().encode(image_path)
 
-def circular_image(path, caption):
-    if os.path.exists(path):
+def circular_image(name, caption):
+    # Team photos live once in the project's image/ folder; use the 180 px derivative when built
+    path = resolve(name)
+    if path is not None:
+        path = image_derivative(path)
         st.markdown(f"""
         <div class="member-card">
-            <img src="data:image/png;base64,{base64_image(path)}" class="circle-img"/>
+            <img src="data:{image_mime(path)};base64,{base64_image(path)}" class="circle-img"/>
             <p><strong>{caption}</strong></p>
         </div>
         """, unsafe_allow_html=True)
     else:
-        st.warning(f"Image not found: {path}")
+        st.warning(f"Image not found: {name}")
 
 # === 💸 Rain animation ===
 rain(
@@ -92,16 +98,16 @@ colored_header(
 )
 
 st.markdown("### 👑 Team Leader")
-circular_image("4.png", "Hồ Trường An – 106240001")
+circular_image("image/4.png", "Hồ Trường An – 106240001")
 
 st.markdown("### 💼 Team Members")
 cols = st.columns(5)
 members = [
-    ("1.png", "Đỗ Lê Thái Khang – 106240444"),
-    ("2.png", "Phạm Trần Diễm Phúc – 106240421"),
-    ("3.png", "Đặng Đức Trung – 103240421"),
-    ("5.png", "Lê Thành Nghị Viện – 103240075"),
-    ("6.png", "Nguyễn Tiến Hảo – 106240541")
+    ("image/1.png", "Đỗ Lê Thái Khang – 106240444"),
+    ("image/2.png", "Phạm Trần Diễm Phúc – 106240421"),
+    ("image/3.png", "Đặng Đức Trung – 103240421"),
+    ("image/5.png", "Lê Thành Nghị Viện – 103240075"),
+    ("image/6.png", "Nguyễn Tiến Hảo – 106240541")
 ]
 for col, (img, cap) in zip(cols, members):
     with col:
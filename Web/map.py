@@ -3,8 +3,17 @@ import streamlit as st
 import pandas as pd
 import numpy as np 
 from pathlib import Path
-import plotly.express as px
-import pycountry 
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.us_states import build_us_state_summary, create_us_states_map
+from utils.figure_cache import get_figure_cache, figure_key, rotation_bucket
+from utils.dataset import DATASET_NAME, dataset_path, dataset_version
+from utils.globe import ROTATION_MODES, enable_client_rotation
+from utils.geometry import apply_country_geometry, geometry_level_for_viewport, geometry_url
+from utils.payload import minimize_figure, render_plotly_chart, chart_sizes
+from utils.map_selection import build_country_lookup, on_country_select
+from utils.lazy import px, pycountry # Only needed when the cached data or figures are (re)built
 
 # --- Streamlit Page Configuration ---
 st.set_page_config(layout="wide", page_title="Billionaires Maps Dashboard")
@@ -18,19 +27,21 @@ if 'map_view_mode' not in st.session_state:
     st.session_state.map_view_mode = "2D Flat Map" 
 if 'clicked_country_data_3d' not in st.session_state: 
     st.session_state.clicked_country_data_3d = None
+if 'clicked_country_data_2d' not in st.session_state:
+    st.session_state.clicked_country_data_2d = None
 if 'selected_iso_on_globe' not in st.session_state: # For linking 3D click to 2D map
     st.session_state.selected_iso_on_globe = None
+if 'us_drilldown' not in st.session_state: # 2D map drilled down to US states
+    st.session_state.us_drilldown = False
 
 
 # --- Robust Data Loading and Initial Column Cleaning ---
-@st.cache_data
-def load_and_prepare_raw_data(csv_filename="Billionaires_Statistics_Dataset.csv"):
+# Frames below are shared by every session and keyed by the dataset version token
+# instead of their content, so a rerun neither hashes nor copies them. Treat them as read-only.
+@st.cache_resource(show_spinner=False)
+def load_and_prepare_raw_data(data_version, csv_filename=DATASET_NAME):
     try:
-        try:
-            script_dir = Path(_file_).parent
-        except NameError:
-            script_dir = Path.cwd()
-        csv_path = script_dir / csv_filename
+        csv_path = dataset_path() or Path(csv_filename)
         df_raw = pd.read_csv(csv_path)
         df = df_raw.copy()
         original_columns = df.columns.tolist()
@@ -52,7 +63,7 @@ def load_and_prepare_raw_data(csv_filename="Billionaires_Statistics_Dataset.csv"
                 return pd.DataFrame()
         return df
     except FileNotFoundError:
-        st.error(f"ERROR: CSV file '{csv_filename}' not found. Please ensure it's in the script's directory.")
+        st.error(f"ERROR: CSV file '{csv_filename}' not found. Please ensure it's in the project root.")
         return pd.DataFrame()
     except Exception as e:
         st.error(f"ERROR loading/processing CSV '{csv_filename}': {e}")
@@ -116,8 +127,9 @@ def get_iso_alpha3_robust(country_name_input):
     except Exception: pass 
     return None
 
-@st.cache_data
-def process_billionaire_data(df_input):
+@st.cache_resource(show_spinner=False)
+def process_billionaire_data(data_version, _df_input):
+    df_input = _df_input
     if df_input.empty: return pd.DataFrame(), pd.DataFrame()
     
     country_col = 'country' 
@@ -163,7 +175,7 @@ COLOR_MAP_SEGMENTS = {
 SEGMENT_ORDER_LEGEND = ["No Data", "1-20", "21-40", "41-60", "60+", "100+", "500+", "700+"]
 
 # --- Map Creation Functions --- 
-def create_2d_map(data_df, highlight_iso=None): 
+def create_2d_map(data_df, highlight_iso=None, geometry_level=None): 
     if data_df.empty: return None
     
     plot_df_2d = data_df.copy()
@@ -208,9 +220,9 @@ def create_2d_map(data_df, highlight_iso=None):
         legend_font=dict(size=12),
         clickmode='event+select'
     )
-    return fig_2d
+    return apply_country_geometry(fig_2d, geometry_level)
 
-def create_3d_globe(data_df, lon_val, lat_val):
+def create_3d_globe(data_df, lon_val, lat_val, geometry_level=None):
     if data_df.empty: return None
     
     plot_df_3d = data_df.copy()
@@ -250,16 +262,21 @@ def create_3d_globe(data_df, lon_val, lat_val):
         legend_title_font_color="white",
         legend_font=dict(color="white", size=12),
     )
-    return fig_3d
+    return apply_country_geometry(fig_3d, geometry_level)
 
 # --- Main Application Logic ---
-raw_dataframe = load_and_prepare_raw_data() 
+figure_cache = get_figure_cache()
+data_version = dataset_version()
+raw_dataframe = load_and_prepare_raw_data(data_version)
 processed_dataframe = pd.DataFrame()        
 unmapped_countries_df = pd.DataFrame()      
+us_state_summary = pd.DataFrame()
+us_region_summary = pd.DataFrame()
 
 if not raw_dataframe.empty:
     try:
-        processed_dataframe, unmapped_countries_df = process_billionaire_data(raw_dataframe)
+        processed_dataframe, unmapped_countries_df = process_billionaire_data(data_version, raw_dataframe)
+        us_state_summary, us_region_summary = build_us_state_summary(raw_dataframe, data_version, "Web/map.py raw")
         if not unmapped_countries_df.empty:
             with st.sidebar.expander(f"⚠️ {len(unmapped_countries_df)} Unmapped Countries/Territories", expanded=False):
                 st.write("These countries/territories could not be mapped to ISO codes and might not appear or be interactive on the maps. You may need to update 'COUNTRY_NAME_MAPPING' or 'MANUAL_ISO_MAP'.")
@@ -268,6 +285,20 @@ if not raw_dataframe.empty:
         st.error(f"An error occurred during data processing: {e}")
         processed_dataframe = pd.DataFrame() 
 
+country_lookup = build_country_lookup(processed_dataframe, data_version, "Web/map.py summary")
+
+# --- Map click handling ---
+MAP_CHART_KEY = "main_map_display_key_unique_v13"
+
+def select_country_on_map(clicked_iso, current_selection):
+    if st.session_state.map_view_mode == "3D Interactive Globe":
+        st.session_state.clicked_country_data_3d = current_selection
+        st.session_state.selected_iso_on_globe = clicked_iso # For 2D map highlight
+    elif st.session_state.map_view_mode == "2D Flat Map":
+        st.session_state.clicked_country_data_2d = current_selection
+        if clicked_iso == "USA": # Drill down to the US states view
+            st.session_state.us_drilldown = True
+
 # --- View Mode Selector (IN SIDEBAR) ---
 st.sidebar.header("Map View Options")
 view_mode_options = ("2D Flat Map", "3D Interactive Globe")
@@ -290,9 +321,17 @@ center_lat_3d = center_lat_3d_default
 st.sidebar.subheader("Clicked Country Details")
 clicked_country_info_display = st.sidebar.empty() # Placeholder for clicked info
 
+globe_rotation_mode = ROTATION_MODES[0]
+
 if st.session_state.map_view_mode == "3D Interactive Globe":
-    center_lon_3d = st.sidebar.slider("Rotate Longitude (3D Globe)", -180, 180, 0, 5, key="lon_slider_sidebar_final_v13")
-    center_lat_3d = st.sidebar.slider("Rotate Latitude (3D Globe)", -90, 90, 20, 5, key="lat_slider_sidebar_final_v13")
+    globe_rotation_mode = st.sidebar.radio(
+        "Globe Rotation:", ROTATION_MODES, key="globe_rotation_mode_selector",
+        help="In browser: drag the globe or use the sliders above it; nothing is sent back to the server. "
+             "Server sliders: every slider tick reruns the app."
+    )
+    if globe_rotation_mode == "Server sliders":
+        center_lon_3d = st.sidebar.slider("Rotate Longitude (3D Globe)", -180, 180, 0, 5, key="lon_slider_sidebar_final_v13")
+        center_lat_3d = st.sidebar.slider("Rotate Latitude (3D Globe)", -90, 90, 20, 5, key="lat_slider_sidebar_final_v13")
     if st.session_state.clicked_country_data_3d:
         info = st.session_state.clicked_country_data_3d
         clicked_country_info_display.markdown(f"*Country:* {info['country_name']}<br>"
@@ -301,6 +340,13 @@ if st.session_state.map_view_mode == "3D Interactive Globe":
     else:
         clicked_country_info_display.info("Click a country on the 3D globe for details.")
 elif st.session_state.map_view_mode == "2D Flat Map":
+    def toggle_us_drilldown():
+        st.session_state.us_drilldown = not st.session_state.us_drilldown
+    if not us_state_summary.empty:
+        st.sidebar.button(
+            "⬅️ Back to World Map" if st.session_state.us_drilldown else "🇺🇸 Drill Down to US States",
+            on_click=toggle_us_drilldown, key="us_drilldown_button"
+        )
     if st.session_state.clicked_country_data_2d:
         info = st.session_state.clicked_country_data_2d
         clicked_country_info_display.markdown(f"*Country:* {info['country_name']}<br>"
@@ -318,48 +364,53 @@ else:
         figure_to_display = None
         config_display = {'displayModeBar': False} 
 
-        if st.session_state.map_view_mode == "2D Flat Map":
+        if st.session_state.map_view_mode == "2D Flat Map" and st.session_state.us_drilldown and not us_state_summary.empty:
+            st.subheader("United States: Billionaires by State")
+            figure_to_display = figure_cache.get_or_build(
+                figure_key("usa-states", data_version=data_version),
+                lambda: minimize_figure(create_us_states_map(us_state_summary))
+            )
+            config_display['scrollZoom'] = False 
+            if not us_region_summary.empty:
+                region_cols = st.columns(len(us_region_summary))
+                for region_col, (_, region_row) in zip(region_cols, us_region_summary.iterrows()):
+                    region_col.metric(region_row['region'], f"{region_row['billionaire_count']:,}", f"${region_row['total_worth'] / 1000:,.0f}B", delta_color="off")
+
+        elif st.session_state.map_view_mode == "2D Flat Map":
             st.subheader("Interactive 2D World Map")
-            figure_to_display = create_2d_map(processed_dataframe, st.session_state.get('selected_iso_on_globe'))
+            highlight_iso = st.session_state.get('selected_iso_on_globe')
+            geometry_level = geometry_level_for_viewport("2d")
+            figure_to_display = figure_cache.get_or_build(
+                figure_key("equirectangular", highlight_iso, None, SEGMENT_ORDER_LEGEND, data_version, geometry_url(geometry_level)),
+                lambda: minimize_figure(create_2d_map(processed_dataframe, highlight_iso, geometry_level), keep_customdata=(3,))
+            )
             config_display['scrollZoom'] = False 
             config_display['dragmode'] = False  
 
         elif st.session_state.map_view_mode == "3D Interactive Globe":
             st.subheader("Interactive 3D Globe")
-            figure_to_display = create_3d_globe(processed_dataframe, center_lon_3d, center_lat_3d)
+            globe_rotation = rotation_bucket(center_lon_3d, center_lat_3d)
+            geometry_level = geometry_level_for_viewport("globe")
+            if globe_rotation_mode == "In browser":
+                # Sent once; later rotations are Plotly relayouts in the browser
+                figure_to_display = figure_cache.get_or_build(
+                    figure_key("orthographic-client", None, globe_rotation, SEGMENT_ORDER_LEGEND, data_version, geometry_url(geometry_level)),
+                    lambda: minimize_figure(enable_client_rotation(create_3d_globe(processed_dataframe, *globe_rotation, geometry_level), *globe_rotation), keep_customdata=(3,))
+                )
+            else:
+                figure_to_display = figure_cache.get_or_build(
+                    figure_key("orthographic", None, globe_rotation, SEGMENT_ORDER_LEGEND, data_version, geometry_url(geometry_level)),
+                    lambda: minimize_figure(create_3d_globe(processed_dataframe, *globe_rotation, geometry_level), keep_customdata=(3,))
+                )
             config_display['dragmode'] = 'orbit' 
 
         if figure_to_display:
-            event_data = st.plotly_chart(figure_to_display, use_container_width=True, key="main_map_display_key_unique_v13", config=config_display, theme="streamlit")
-            
-            # Handle click events for the CURRENTLY DISPLAYED map
-            if isinstance(event_data, dict) and "points" in event_data and event_data.get("points"):
-                clicked_point_data = event_data["points"][0]
-                clicked_iso = clicked_point_data.get("location")
-                
-                if not clicked_iso and 'customdata' in clicked_point_data and isinstance(clicked_point_data['customdata'], list) and len(clicked_point_data['customdata']) > 3:
-                    clicked_iso = clicked_point_data['customdata'][3] # iso_alpha is 4th item in custom_data
-                
-                if clicked_iso:
-                    country_info_row = processed_dataframe[processed_dataframe['iso_alpha'] == clicked_iso]
-                    if not country_info_row.empty:
-                        info = country_info_row.iloc[0].to_dict()
-                        current_selection = {
-                            'country_name': info['country_name'],
-                            'billionaire_count': info['billionaire_count'],
-                            'billionaire_segment': info['billionaire_segment']
-                        }
-                        
-                        if st.session_state.map_view_mode == "3D Interactive Globe":
-                            if st.session_state.clicked_country_data_3d != current_selection:
-                                st.session_state.clicked_country_data_3d = current_selection
-                                st.session_state.selected_iso_on_globe = clicked_iso # For 2D map highlight
-                                st.experimental_rerun()
-                        elif st.session_state.map_view_mode == "2D Flat Map":
-                            if st.session_state.clicked_country_data_2d != current_selection:
-                                st.session_state.clicked_country_data_2d = current_selection
-                                # st.session_state.selected_iso_on_globe = clicked_iso # Update for 2D map's own highlight
-                                st.experimental_rerun()
+            # Clicks update session state in the on_select callback, before the one rerun they trigger
+            render_plotly_chart(
+                figure_to_display, f"web_map_{st.session_state.map_view_mode}", minimize=False, use_container_width=True,
+                key=MAP_CHART_KEY, config=config_display, theme="streamlit",
+                on_select=on_country_select(MAP_CHART_KEY, country_lookup, select_country_on_map), selection_mode="points"
+            )
         else:
             st.warning(f"Could not generate {st.session_state.map_view_mode}. Ensure data with ISO codes is available.")
 
@@ -369,5 +420,10 @@ if st.sidebar.checkbox("Show Full Processed Data Table (for debugging)"):
         st.sidebar.dataframe(processed_dataframe.sort_values(by=['iso_alpha', 'country_name']))
     else:
         st.sidebar.write("No processed data to display.")
+    cache_stats = figure_cache.stats()
+    st.sidebar.caption(f"Figure cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                       f"{cache_stats['entries']} entries ({cache_stats['bytes'] / 1024:,.0f} KB)")
+    for chart_label, chart_size in chart_sizes().items():
+        st.sidebar.caption(f"{chart_label}: {chart_size['bytes'] / 1024:,.1f} KB sent")
 
 st.caption("Maps generated using Plotly Express.")
\ No newline at end of file
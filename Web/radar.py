@@ -2,9 +2,15 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.dataset import dataset_path, dataset_version
+from utils.similarity import build_country_similarity, get_similar_countries, get_industry_shares
 
 # --- Load data ---
-billionaires = pd.read_csv("Billionaires_Statistics_Dataset.csv")
+billionaires = pd.read_csv(dataset_path())
 
 # --- Lấy tất cả ngành có trong dữ liệu ---
 all_industries = sorted(billionaires['industries'].dropna().unique())
@@ -26,9 +32,11 @@ def get_country_values(country):
     values += values[:1]  # close loop
     return values
 
+# --- Hồ sơ ngành của mọi quốc gia (cosine similarity) ---
+similarity_data = build_country_similarity(billionaires, dataset_version(), "Web/radar.py", country_col='country', industry_col='industries')
+
 # --- Vẽ radar chart ---
-def plot_radar_chart(country):
-    values = get_country_values(country)
+def plot_radar_chart(country, neighbours=()):
     categories = all_industries
     N = len(categories)
 
@@ -37,19 +45,35 @@ def plot_radar_chart(country):
 
     fig = go.Figure()
 
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=angles,
-        fill='toself',
-        name=country,
-        marker=dict(symbol='circle', size=6)
-    ))
+    if neighbours:
+        # Compare shapes, not sizes: each country's share of its own billionaires
+        for name in [country] + [neighbour for neighbour, _ in neighbours]:
+            values = get_industry_shares(similarity_data, name, categories)
+            values += values[:1]
+            fig.add_trace(go.Scatterpolar(
+                r=values,
+                theta=angles,
+                fill='toself' if name == country else 'none',
+                name=name,
+                marker=dict(symbol='circle', size=6)
+            ))
+        radial_max = max(max(trace.r) for trace in fig.data)
+    else:
+        values = get_country_values(country)
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=angles,
+            fill='toself',
+            name=country,
+            marker=dict(symbol='circle', size=6)
+        ))
+        radial_max = max(values)
 
     fig.update_layout(
         polar=dict(
             radialaxis=dict(
                 visible=True,
-                range=[0, max(values) + 10]
+                range=[0, radial_max + 10]
             ),
             angularaxis=dict(
                 tickmode='array',
@@ -57,7 +81,7 @@ def plot_radar_chart(country):
                 ticktext=categories
             )
         ),
-        showlegend=False,
+        showlegend=bool(neighbours),
         title=f"Radar Chart of Billionaires' Industries in {country}",
         width=600,
         height=600,
@@ -70,5 +94,9 @@ st.title("Billionaires' Industry Distribution")
 
 all_countries = sorted(df_filtered['country'].dropna().astype(str).unique())
 selected_country = st.selectbox("Select a country", all_countries)
+show_similar = st.checkbox("Overlay countries with a similar billionaire profile")
+similar_countries = get_similar_countries(similarity_data, selected_country) if show_similar else []
+if similar_countries:
+    st.caption("Most similar industry mix (cosine similarity): " + ", ".join(f"{name} ({score:.2f})" for name, score in similar_countries))
 
-plot_radar_chart(selected_country)
+plot_radar_chart(selected_country, similar_countries)
@@ -2,13 +2,21 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.figure_cache import get_figure_cache, figure_key
+from utils.dataset import dataset_path, dataset_version
+from utils.industry_bundle import build_industry_bundle
+from utils.payload import minimize_figure, render_plotly_chart
 
 # --- Set Streamlit layout to wide ---
 st.set_page_config(layout="wide")
 st.title("Billionaires' Industry Insights")
 
 # --- Load and clean data ---
-df = pd.read_csv("Billionaires_Statistics_Dataset.csv")
+df = pd.read_csv(dataset_path())
 df = df.dropna(subset=['industries', 'finalWorth', 'country'])
 
 # --- Determine top 6 industries by net worth ---
@@ -41,8 +49,19 @@ industry_counts = (
     .reindex(index=selected_industries, columns=top_countries, fill_value=0)
 )
 
-# --- Select country ---
-selected_country = st.selectbox("Select a country", top_countries)
+# --- Build industry net worth matrix ---
+industry_worth = (
+    df_filtered[df_filtered['country'].isin(top_countries)]
+    .groupby(['industries', 'country'])['finalWorth']
+    .sum()
+    .unstack(fill_value=0)
+    .reindex(index=selected_industries, columns=top_countries, fill_value=0)
+)
+
+# --- Select country: in the browser from a pre-built bundle, or on the server ---
+switch_in_browser = st.toggle("Switch countries instantly in the browser", value=True)
+if not switch_in_browser:
+    selected_country = st.selectbox("Select a country", top_countries)
 
 # --- Get country-specific industry count values ---
 def get_country_values(country):
@@ -106,19 +125,28 @@ def plot_bar_chart(country):
     )
     return fig
 
-# --- Layout: radar and bar charts side-by-side ---
-col1, col2 = st.columns(2)
-with col1:
-    st.plotly_chart(plot_radar_chart(selected_country), use_container_width=True)
-
-with col2:
-    st.plotly_chart(plot_bar_chart(selected_country), use_container_width=True)
-
-# --- Subtitle centered ---
-st.markdown(
-    f"<h3 style='text-align: center; font-weight:600;'>Billionaire Wealth and Number in {selected_country}</h3>",
-    unsafe_allow_html=True
-)
+# --- Layout: one bundle for all top countries, or radar and bar charts side-by-side ---
+if switch_in_browser:
+    figure_cache = get_figure_cache()
+    data_version = dataset_version()
+    industry_bundle = figure_cache.get_or_build(
+        figure_key("industry-bundle-web", segment_spec=top_countries, data_version=data_version),
+        lambda: minimize_figure(build_industry_bundle(industry_counts, industry_worth))
+    )
+    render_plotly_chart(industry_bundle, "industry_bundle", minimize=False, use_container_width=True)
+else:
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(plot_radar_chart(selected_country), use_container_width=True)
+
+    with col2:
+        st.plotly_chart(plot_bar_chart(selected_country), use_container_width=True)
+
+    # --- Subtitle centered ---
+    st.markdown(
+        f"<h3 style='text-align: center; font-weight:600;'>Billionaire Wealth and Number in {selected_country}</h3>",
+        unsafe_allow_html=True
+    )
 
 
 # --- Styled analysis block ---
@@ -178,6 +206,10 @@ country_insights = {
     """
 }
 
-# --- Display styled insight ---
-if selected_country in country_insights:
+# --- Display styled insight (tabs also switch in the browser) ---
+if switch_in_browser:
+    for tab, country in zip(st.tabs(top_countries), top_countries):
+        if country in country_insights:
+            tab.markdown(country_insights[country], unsafe_allow_html=True)
+elif selected_country in country_insights:
     st.markdown(country_insights[selected_country], unsafe_allow_html=True)
@@ -0,0 +1,96 @@
+# Per-rerun cost of Web/map.py's cached data stages: content-keyed st.cache_data
+# (hash the input frame, unpickle a fresh copy on every hit) against the
+# version-keyed st.cache_resource it now uses (dict lookup, shared object).
+#
+#   python benchmarks/bench_cache_keys.py [--scale N]
+#
+# --scale repeats the dataset N times to show how each approach grows with size.
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from utils.dataset import dataset_path, dataset_version
+from utils.us_states import build_us_state_summary
+
+REPEATS = 20
+
+
+def read_raw(scale):
+    df = pd.read_csv(dataset_path())
+    df.columns = df.columns.str.replace(' ', '_', regex=False).str.lower()
+    return pd.concat([df] * scale, ignore_index=True) if scale > 1 else df
+
+
+def summarize(df):
+    return df.groupby('country', as_index=False).size().rename(columns={'size': 'billionaire_count'})
+
+
+# --- Before: keyed by content ---
+@st.cache_data(show_spinner=False)
+def load_by_content(scale):
+    return read_raw(scale)
+
+
+@st.cache_data(show_spinner=False)
+def process_by_content(df):
+    return summarize(df)
+
+
+@st.cache_data(show_spinner=False)
+def us_summary_by_content(df):
+    return build_us_state_summary.__wrapped__(df, None, "bench")
+
+
+# --- After: keyed by the dataset version token ---
+@st.cache_resource(show_spinner=False)
+def load_by_version(data_version, scale):
+    return read_raw(scale)
+
+
+@st.cache_resource(show_spinner=False)
+def process_by_version(data_version, _df):
+    return summarize(_df)
+
+
+def per_call_ms(call):
+    call()
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        call()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main(scale):
+    raw = load_by_content(scale)
+    print(f"rows: {len(raw):,}  columns: {raw.shape[1]}  in memory: {raw.memory_usage(deep=True).sum() / 1e6:.1f} MB")
+    stages = [
+        ("load raw frame",
+         lambda: load_by_content(scale),
+         lambda: load_by_version(dataset_version(), scale)),
+        ("process_billionaire_data",
+         lambda: process_by_content(raw),
+         lambda: process_by_version(dataset_version(), raw)),
+        ("build_us_state_summary",
+         lambda: us_summary_by_content(raw),
+         lambda: build_us_state_summary(raw, dataset_version(), "bench")),
+    ]
+    print(f"{'stage (cache hit)':<28}{'content ms':>12}{'version ms':>12}{'speedup':>10}")
+    totals = [0.0, 0.0]
+    for label, before, after in stages:
+        before_ms, after_ms = per_call_ms(before), per_call_ms(after)
+        totals[0] += before_ms
+        totals[1] += after_ms
+        print(f"{label:<28}{before_ms:>12.2f}{after_ms:>12.3f}{before_ms / after_ms:>9.0f}x")
+    print(f"{'per rerun':<28}{totals[0]:>12.2f}{totals[1]:>12.3f}{totals[0] / totals[1]:>9.0f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=int, default=1)
+    main(parser.parse_args().scale)
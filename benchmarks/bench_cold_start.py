@@ -0,0 +1,75 @@
+# Cold-start import cost of every page: what a fresh process (a new deploy or an
+# autoscaled replica) imports and spends before the first render is complete.
+#
+#   python benchmarks/bench_cold_start.py ["pages/04_Billionaires Analysis.py" ...]
+#
+# Each page runs once through AppTest in its own `python -X importtime` process.
+# Imports made by Streamlit and AppTest themselves are excluded; the rest are
+# what the page (and the utils it pulls in) pays for. "first run" is the wall
+# time of that first script run, imports included.
+import argparse
+import glob
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_PAGES = ["Introduction.py"] + sorted(glob.glob("pages/*.py", root_dir=ROOT))
+PAGE_MARKER = "--- page run ---"
+TOP_PACKAGES = 4
+
+RUNNER = f"""
+import os, sys, time
+from streamlit.testing.v1 import AppTest
+page = sys.argv[1]
+os.chdir({str(ROOT)!r})
+sys.path.insert(0, {str(ROOT)!r})
+app = AppTest.from_file(os.path.abspath(page), default_timeout=300)
+sys.stderr.write({PAGE_MARKER!r} + "\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+app.run()
+print(f"{{(time.perf_counter() - start) * 1000:.1f}} {{len(app.exception)}}")
+"""
+
+
+def parse_importtime(stderr):
+    # Lines look like "import time:   self_us |  cumulative_us | <indent>module"
+    _, _, page_part = stderr.partition(PAGE_MARKER)
+    by_package = defaultdict(int)
+    modules = 0
+    for line in page_part.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        by_package[name.strip().split(".")[0]] += int(self_us)
+        modules += 1
+    return modules, by_package
+
+
+def profile_page(page):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, page],
+        capture_output=True, text=True, cwd=ROOT
+    )
+    run_ms, exceptions = (result.stdout.split() + ["nan", "?"])[:2]
+    modules, by_package = parse_importtime(result.stderr)
+    return float(run_ms), exceptions, modules, by_package
+
+
+def main(pages):
+    print(f"{'page':<42}{'first run ms':>13}{'import ms':>11}{'modules':>9}  heaviest imports (ms)")
+    for page in pages:
+        run_ms, exceptions, modules, by_package = profile_page(page)
+        import_ms = sum(by_package.values()) / 1000
+        heaviest = sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:TOP_PACKAGES]
+        top = ", ".join(f"{name} {us / 1000:.0f}" for name, us in heaviest)
+        note = "" if exceptions == "0" else f"  [{exceptions} exception(s)]"
+        print(f"{Path(page).stem[:41]:<42}{run_ms:>13.1f}{import_ms:>11.1f}{modules:>9}  {top}{note}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pages", nargs="*", default=DEFAULT_PAGES)
+    main(parser.parse_args().pages)
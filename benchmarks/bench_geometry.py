@@ -0,0 +1,104 @@
+# Payload size and build/render time of the world choropleth at each geometry level.
+#
+#   python benchmarks/bench_geometry.py
+#
+# "plotly-default" leaves the shapes to Plotly's own world topojson, which the
+# browser downloads separately from the CDN and is not counted here. The bundled
+# levels are referenced by their asset-store URL, so they are likewise a separate,
+# cached download ("file KB"). Every country in the dataset is plotted, mapped to
+# ISO alpha-3 the way the pages do; "missing" counts those without an outline at the
+# level, any of which sends the figure back to the default shapes. Static render
+# times need kaleido; without it that column is left empty.
+import gzip
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+import pycountry
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from utils.dataset import dataset_path
+from utils.geometry import GEOMETRY_LEVELS, available_iso_codes, geometry_name, use_country_geometry
+from utils.store import resolve, store_url
+
+REPEATS = 5
+# Names pycountry only matches fuzzily in this dataset
+MANUAL_ISO_MAP = {"Eswatini (Swaziland)": "SWZ", "Turkey": "TUR", "Russia": "RUS"}
+
+
+def country_iso(name):
+    if name in MANUAL_ISO_MAP:
+        return MANUAL_ISO_MAP[name]
+    try:
+        return pycountry.countries.lookup(name).alpha_3
+    except LookupError:
+        pass
+    try:
+        return pycountry.countries.search_fuzzy(name)[0].alpha_3
+    except LookupError:
+        return None
+
+
+def country_summary():
+    df = pd.read_csv(dataset_path())
+    summary = df.groupby("country").size().reset_index(name="billionaire_count")
+    summary["iso_alpha"] = summary["country"].map(country_iso)
+    summary["billionaire_segment"] = pd.cut(
+        summary["billionaire_count"], [0, 20, 40, 60, 99, 499, 699, 10**6],
+        labels=["1-20", "21-40", "41-60", "60+", "100+", "500+", "700+"]
+    ).astype(str)
+    return summary.dropna(subset=["iso_alpha"])
+
+
+def level_url(level):
+    # The URL the app would serve the level at; outside `streamlit run` there is no server to ask
+    return store_url(geometry_name(level)) if level else None
+
+
+def build(summary, level, projection):
+    fig = px.choropleth(
+        summary, locations="iso_alpha", color="billionaire_segment",
+        hover_name="country", projection=projection
+    )
+    return use_country_geometry(fig, level, level_url(level))
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = func()
+    return result, (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    try:
+        import kaleido  # noqa: F401
+        can_render = True
+    except ImportError:
+        can_render = False
+
+    summary = country_summary()
+    unmapped = summary["iso_alpha"].isna().sum()
+    summary = summary.dropna(subset=["iso_alpha"])
+    print(f"{len(summary)} countries ({unmapped} without an ISO code), {REPEATS} repeats\n")
+    print(f"{'level':<16}{'projection':<17}{'missing':>8}{'json KB':>9}{'gzip KB':>9}{'file KB':>9}{'build ms':>10}{'render ms':>11}")
+    for level in [None] + list(GEOMETRY_LEVELS):
+        file_kb = f"{resolve(geometry_name(level)).stat().st_size / 1024:.1f}" if level else ""
+        missing = len(set(summary["iso_alpha"]) - available_iso_codes(level)) if level else ""
+        for projection in ("equirectangular", "orthographic"):
+            fig, build_ms = timed(lambda: build(summary, level, projection))
+            spec = pio.to_json(fig, validate=False)
+            render = ""
+            if can_render:
+                _, render_ms = timed(lambda: fig.to_image(format="png", width=900, height=500))
+                render = f"{render_ms:.0f}"
+            print(f"{level or 'plotly-default':<16}{projection:<17}{missing:>8}{len(spec) / 1024:>9.1f}"
+                  f"{len(gzip.compress(spec.encode())) / 1024:>9.1f}{file_kb:>9}{build_ms:>10.1f}{render:>11}")
+
+
+if __name__ == "__main__":
+    main()
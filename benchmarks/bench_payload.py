@@ -0,0 +1,49 @@
+# Serialized size of every chart a page sends, checked against its byte budget.
+#
+#   python benchmarks/bench_payload.py ["pages/04_Billionaires Analysis.py" ...]
+#
+# Pages run headless through Streamlit's AppTest; each render_plotly_chart call
+# records its size. Exits with status 1 when any chart is over budget, so it can
+# gate CI.
+import os
+import sys
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from utils.payload import FigureBudgetExceeded, chart_sizes, check_figure_budget
+
+DEFAULT_PAGES = ["pages/04_Billionaires Analysis.py", "Web/map.py"]
+
+
+def run_page(page):
+    # Pages resolve images relative to the working directory, as under `streamlit run`
+    os.chdir(ROOT)
+    app = AppTest.from_file(str(ROOT / page), default_timeout=120)
+    app.run()
+    return [e.value for e in app.exception]
+
+
+def main(pages):
+    failures = []
+    for page in pages:
+        errors = run_page(page)
+        if errors:
+            failures.append(f"{page}: {errors[0]}")
+    print(f"{'chart':<36}{'KB':>9}{'budget KB':>11}")
+    for label, size in sorted(chart_sizes().items()):
+        budget = size['budget']
+        print(f"{label:<36}{size['bytes'] / 1024:>9.1f}{(budget / 1024 if budget else float('nan')):>11.1f}")
+        try:
+            check_figure_budget(label, size['bytes'], budget)
+        except FigureBudgetExceeded as e:
+            failures.append(str(e))
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or DEFAULT_PAGES))
@@ -1,8 +1,9 @@
 import streamlit as st
 import os
-import base64
 from streamlit_extras.colored_header import colored_header
 from streamlit_extras.let_it_rain import rain
+from utils.images import image_derivative
+from utils.static_assets import media_src
 
 
 # === Page settings ===
@@ -55,11 +56,11 @@ member_details = {
 # === Helper: Load Circular Image ===
 def circular_image(full_path, caption):
    if os.path.exists(full_path):
-       with open(full_path, "rb") as img_file:
-           b64 = base64.b64encode(img_file.read()).decode()
+       # Pre-cropped 180 px circle from scripts/build_image_assets.py when built
+       img_src = media_src(image_derivative(full_path))
        st.markdown(f"""
            <div class="member-card">
-               <img src="data:image/png;base64,{b64}" class="circle-img"/>
+               <img src="{img_src}" class="circle-img" style="width: 180px; height: 180px; border-radius: 50%; object-fit: cover;"/>
                <p><strong>{caption}</strong></p>
            </div>
        """, unsafe_allow_html=True)
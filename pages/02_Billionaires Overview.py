@@ -2,7 +2,9 @@ import streamlit as st
 import streamlit_lottie as st_lottie
 from streamlit_extras.colored_header import colored_header
 import os
-import base64
+from utils.images import image_derivative
+from utils.lottie import load_lottie
+from utils.static_assets import media_src, prefetch_media
 
 
 
@@ -36,10 +38,11 @@ with cl1_intro:
     </div>
     """, unsafe_allow_html=True)
 with cl2_intro:
-    try:
-        st.lottie("https://lottie.host/362e9c68-2e7f-4f0c-a88c-28f6dd93af97/4ySes9wMJy.json", key="data")
-    except Exception as e:
-        st.warning(f"Could not load Lottie animation: {e}")
+    animation = load_lottie("billionaire_intro")
+    if animation:
+        st_lottie.st_lottie(animation, key="data")
+    else:
+        st.warning("Could not load the Lottie animation.")
 
 
 
@@ -168,7 +171,12 @@ def go_prev():
 billionaire = billionaires_info[st.session_state.page]
 script_dir = os.path.dirname(os.path.abspath(__file__))
 img_path_relative = f"../image/billionaire-{st.session_state.page + 1}.png"
-img_path_absolute = os.path.join(script_dir, img_path_relative)
+img_path_absolute = image_derivative(os.path.join(script_dir, img_path_relative))
+neighbour_img_paths = [
+    image_derivative(os.path.join(script_dir, f"../image/billionaire-{page + 1}.png"))
+    for page in (st.session_state.page - 1, st.session_state.page + 1)
+    if 0 <= page < total_pages
+]
 
 
 
@@ -191,16 +199,19 @@ with st.container():
 
 
         # Load and encode image
-        try:
-            with open(img_path_absolute, "rb") as img_file:
-                b64 = base64.b64encode(img_file.read()).decode()
+        img_src = media_src(img_path_absolute)
+        if img_src:
             st.markdown(f"""
                 <div class="member-card">
-                    <img src="data:image/jpeg;base64,{b64}" class="billionaire-img"/>
+                    <img src="{img_src}" class="billionaire-img"/>
                 </div>
             """, unsafe_allow_html=True)
-        except Exception as e:
-            st.error(f"Error loading image: {e}")
+        else:
+            st.error(f"Error loading image: {img_path_absolute}")
+        # Get the previous and next portraits ready before the arrows are clicked
+        prefetch_html = prefetch_media(neighbour_img_paths)
+        if prefetch_html:
+            st.markdown(prefetch_html, unsafe_allow_html=True)
     with col2:
         st.markdown("<br>", unsafe_allow_html=True)
 
@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
-import base64
+from utils.dataset import dataset_path, dataset_version
+from utils.static_assets import media_src
+from utils.table import filter_rows, render_paginated_table
+from utils.export import EXPORT_FORMATS, available_export_formats, export_rows
 
 
 
@@ -104,17 +107,16 @@ with st.container():
     col1, col2 = st.columns([1, 2])
     with col1:
         # Load and encode image
-        try:
-            with open("image/nidula_profile.jpg", "rb") as img_file:
-                b64 = base64.b64encode(img_file.read()).decode()
+        img_src = media_src("image/nidula_profile.jpg")
+        if img_src:
             st.markdown(f"""
                 <div class="member-card">
-                    <img src="data:image/jpeg;base64,{b64}" class="circle-img"/>
+                    <img src="{img_src}" class="circle-img"/>
                     <p><strong>Nidula Elgiriyewithana</strong></p>
                 </div>
             """, unsafe_allow_html=True)
-        except Exception as e:
-            st.error(f"Error loading image: {e}")
+        else:
+            st.error("Error loading image: image/nidula_profile.jpg")
     with col2:
         st.markdown("""
 **Data Scientist** specializing in AI & Data Science  
@@ -132,8 +134,18 @@ Currently pursuing a BSc (Hons) in AI & Data Science, focusing on:
 
 
 # === Load Dataset ===
-df = pd.read_csv("Billionaires_Statistics_Dataset.csv")
-df = df.dropna(subset=['personName', 'finalWorth', 'country', 'industries'])
+# Shared across sessions and keyed by the dataset version; the page treats the frame as read-only
+@st.cache_resource(show_spinner=False)
+def load_data(csv_path, data_version):
+    df = pd.read_csv(csv_path)
+    return df.dropna(subset=['personName', 'finalWorth', 'country', 'industries']).reset_index(drop=True)
+
+
+
+
+csv_path = dataset_path()
+data_version = dataset_version(csv_path)
+df = load_data(csv_path, data_version)
 
 
 
@@ -192,14 +204,36 @@ else:
 
 
 if filter_countries and filter_industries:
-    filtered_df = df[
+    filtered_rows = filter_rows(
         (df['country'].isin(filter_countries)) &
         (df['industries'].isin(filter_industries)) &
         (df['finalWorth'] >= selected_worth[0]) &
         (df['finalWorth'] <= selected_worth[1])
-    ]
-    st.markdown(f"**Filtered Records:** `{filtered_df.shape[0]}` billionaire(s)")
-    st.dataframe(filtered_df)
+    )
+    st.markdown(f"**Filtered Records:** `{len(filtered_rows)}` billionaire(s)")
+    render_paginated_table(df, filtered_rows, data_version, "pages/03", key="dataset_table")
+
+
+
+
+    # Export the same filtered rows; files are written in chunks only when a button is clicked
+    st.markdown("### ⬇️ Download Dataset")
+    shown_only = st.checkbox("Only export the columns shown in the table", key="export_shown_columns")
+    export_columns = st.session_state.get("dataset_table_columns") if shown_only else list(df.columns)
+    export_columns = export_columns or list(df.columns)
+    export_cols = st.columns(len(EXPORT_FORMATS))
+    for col, fmt in zip(export_cols, EXPORT_FORMATS):
+        extension, mime = EXPORT_FORMATS[fmt]
+        col.download_button(
+            f"Download {fmt}",
+            data=lambda fmt=fmt: export_rows(df, filtered_rows, export_columns, fmt),
+            file_name=f"billionaires_selection.{extension}",
+            mime=mime,
+            on_click="ignore",
+            disabled=fmt not in available_export_formats(len(filtered_rows)),
+            key=f"export_{extension}",
+            use_container_width=True
+        )
 else:
     st.warning("Please select at least one country and one industry to view filtered data.")
 
@@ -1,11 +1,28 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 from pathlib import Path
-import plotly.express as px
 import plotly.graph_objects as go
-import pycountry
 from annotated_text import annotated_text
+from utils.age_worth import (
+  SCATTER_SAMPLE_POINTS, build_age_worth_bins, get_age_worth_histogram, get_age_worth_points,
+  plot_age_worth_density, plot_age_worth_scatter, sample_points, scatter_budget
+)
+from utils.indicators import (
+  BILLIONAIRE_METRICS, INDICATOR_COLUMNS, FEATURE_LABELS,
+  build_country_indicator_matrix, plot_correlation_heatmap, plot_indicator_scatter
+)
+from utils.similarity import build_country_similarity, get_similar_countries, get_industry_shares
+from utils.figure_cache import get_figure_cache, figure_key
+from utils.dataset import DATASET_NAME, dataset_path, dataset_version
+from utils.globe import enable_client_rotation
+from utils.geometry import apply_country_geometry, geometry_level_for_viewport, geometry_url
+from utils.payload import minimize_figure, render_plotly_chart
+from utils.industry_bundle import build_industry_bundle
+from utils.migration import ALL_OPTION, FLOW_DIMENSIONS, build_migration_flows, get_migration_slice, plot_migration_sankey
+from utils.map_selection import build_country_lookup, on_country_select
+# Only needed when the cached data or figures are (re)built
+from utils.lazy import px, pycountry
+
 
 
 
@@ -53,7 +70,7 @@ if 'target_lon' not in st.session_state:
 if 'target_lat' not in st.session_state:
   st.session_state.target_lat = 20
 if 'selected_country_for_info' not in st.session_state:
-  st.session_state.selected_country_for_info = "All Countries"
+  st.session_state.selected_country_for_info = "Global Overview"
 if 'selected_country_iso_for_globe_highlight' not in st.session_state:
   st.session_state.selected_country_iso_for_globe_highlight = None
 
@@ -143,14 +160,12 @@ def get_iso_alpha3_robust(country_name_input):
 
 
 
-@st.cache_data
-def load_and_process_data(csv_filename="Billionaires_Statistics_Dataset.csv"):
+# Shared across sessions and keyed by the dataset version; callers treat the frames as read-only
+@st.cache_resource(show_spinner=False)
+def load_and_process_data(data_version, csv_filename=DATASET_NAME):
   try:
-      try: script_dir = Path(__file__).parent
-      except NameError: script_dir = Path.cwd()
-      csv_path = script_dir / csv_filename
-      df_raw = pd.read_csv(csv_path)
-      df = df_raw.copy()
+      csv_path = dataset_path() or Path(csv_filename)
+      df = pd.read_csv(csv_path)
       original_columns = df.columns.tolist()
       df.columns = df.columns.str.replace(' ', '_', regex=False).str.lower()
 
@@ -214,6 +229,16 @@ def load_and_process_data(csv_filename="Billionaires_Statistics_Dataset.csv"):
 
 
 
+      # Display labels for the wealth source donut, computed once here instead of per rerun
+      if 'status' in df.columns:
+          df['status_label'] = df['status'].replace({'D': 'Entrepreneur', 'U': 'Inherited'})
+          df['status_label'] = df['status_label'].where(~df['status_label'].isin(['E', 'R', 'N', 'Split Family Fortune']), 'Others')
+      if 'selfMade' in df.columns:
+          df['self_made_label'] = df['selfMade'].map({True: 'Self-made', False: 'Not Self-made'}).fillna(df['selfMade'].astype(str))
+
+
+
+
       country_col = 'country'
       df[country_col] = df[country_col].astype(str).str.strip()
       df = df[df[country_col].str.lower() != 'nan']
@@ -261,8 +286,18 @@ def load_and_process_data(csv_filename="Billionaires_Statistics_Dataset.csv"):
 
 
 
+# --- Rows complete in the given columns, filtered once per dataset version ---
+@st.cache_resource(show_spinner=False)
+def load_complete_rows(data_version, _df, columns):
+  return _df.dropna(subset=list(columns))
+
+
+
+
 # --- Load Data ---
-df_full_details, billionaire_summary_data, unmapped_countries_df, error_msg = load_and_process_data()
+data_version = dataset_version()
+df_full_details, billionaire_summary_data, unmapped_countries_df, error_msg = load_and_process_data(data_version)
+figure_cache = get_figure_cache()
 
 
 
@@ -332,172 +367,212 @@ ANALYSIS_TEXTS = {
 
 
 
-# Two-Column Layout for Globe and Filter/Details
-col_globe, col_filter_info = st.columns([3, 2])
-
+fixed_country_options_display = ["United States of America", "China", "India"]
 
 
 
-with col_globe:
-  st.subheader("Interactive 3D Billionaires Globe")
-  data_for_globe_plot = billionaire_summary_data.dropna(subset=['iso_alpha']).copy()
-  color_column_for_globe = 'billionaire_segment'
-  current_color_map = color_map_segments.copy()
-  current_segment_order = base_segment_order.copy()
-
 
+# Selecting a country re-targets the globe before the section reruns, so it renders in a single pass;
+# reacting only to the selectbox's own changes also keeps a country clicked on the globe selected
+def focus_globe_on_country():
+  selected_country_name = st.session_state.country_selector_fixed_top3
+  st.session_state.selected_country_for_info = selected_country_name
+  if selected_country_name == "Global Overview":
+      st.session_state.selected_country_iso_for_globe_highlight = None
+      st.session_state.target_lon = 0
+      st.session_state.target_lat = 20
+  else:
+      country_data_for_iso = billionaire_summary_data[billionaire_summary_data['country_name'] == selected_country_name]
+      if not country_data_for_iso.empty:
+          st.session_state.selected_country_iso_for_globe_highlight = country_data_for_iso.iloc[0]['iso_alpha']
+      else:
+          st.session_state.selected_country_iso_for_globe_highlight = None
+      coords = COUNTRY_COORDS_FOR_GLOBE.get(selected_country_name, {"lon": 0, "lat": 20})
+      st.session_state.target_lon = coords['lon']
+      st.session_state.target_lat = coords['lat']
 
 
-  selected_iso_highlight = st.session_state.get('selected_country_iso_for_globe_highlight')
 
 
+# Clicking a country on the globe shows its details; the view turns only to countries with known coordinates
+GLOBE_CHART_KEY = "main_3d_globe"
+country_lookup = build_country_lookup(billionaire_summary_data, data_version, "pages/04 summary")
 
 
-  if selected_iso_highlight:
-      color_column_for_globe = 'display_segment_globe'
-      data_for_globe_plot[color_column_for_globe] = "Other Countries"
-      selected_country_actual_segment_series = data_for_globe_plot.loc[data_for_globe_plot['iso_alpha'] == selected_iso_highlight, 'billionaire_segment']
-      if not selected_country_actual_segment_series.empty:
-          actual_segment = selected_country_actual_segment_series.iloc[0]
-          data_for_globe_plot.loc[data_for_globe_plot['iso_alpha'] == selected_iso_highlight, color_column_for_globe] = actual_segment
-      if "Other Countries" not in current_segment_order:
-          current_segment_order = globe_segment_order_with_others.copy()
+def select_country_on_globe(clicked_iso, current_selection):
+  clicked_country_name = current_selection['country_name']
+  st.session_state.selected_country_for_info = clicked_country_name
+  st.session_state.selected_country_iso_for_globe_highlight = clicked_iso
+  if clicked_country_name in COUNTRY_COORDS_FOR_GLOBE:
+      st.session_state.target_lon = COUNTRY_COORDS_FOR_GLOBE[clicked_country_name]['lon']
+      st.session_state.target_lat = COUNTRY_COORDS_FOR_GLOBE[clicked_country_name]['lat']
+  if clicked_country_name in fixed_country_options_display:
+      st.session_state.country_selector_fixed_top3 = clicked_country_name
 
 
 
 
-  if not data_for_globe_plot.empty:
-      fig_globe = px.choropleth(
-          data_for_globe_plot,
-          locations="iso_alpha",
-          color=color_column_for_globe,
-          hover_name="country_name",
-          hover_data={"billionaire_count": True, color_column_for_globe: False, "billionaire_segment": True, "iso_alpha": False},
-          projection="orthographic",
-          color_discrete_map=current_color_map,
-          category_orders={color_column_for_globe: current_segment_order}
-      )
-      current_lon = st.session_state.get('target_lon', 0)
-      current_lat = st.session_state.get('target_lat', 20)
+# Two-Column Layout for Globe and Filter/Details; the section reruns on its own when its selectbox changes
+@st.fragment
+def render_globe_section():
+  col_globe, col_filter_info = st.columns([3, 2])
 
 
 
 
-      fig_globe.update_layout(
-          height=600,
-          margin={"r":10,"t":10,"l":10,"b":10},
-          geo=dict(
-              showland=True, landcolor="rgb(200, 200, 200)",
-              showocean=True, oceancolor="rgb(100, 150, 200)",
-              bgcolor='rgba(0,0,0,0)',
-              projection=dict(
-                  type='orthographic',
-                  scale=0.85,
-                  rotation=dict(lon=current_lon, lat=current_lat, roll=0)
-              )
-          ),
-          paper_bgcolor='rgba(0,0,0,0)',
-          legend=dict(
-              title_text='Billionaire Segments', orientation="v",
-              yanchor="middle", y=0.5, xanchor="left", x=1.02,
-              font=dict(size=12)
-          ),
-          uirevision=f'globe_view_lon{current_lon}_lat{current_lat}_sel{selected_iso_highlight}'
+  with col_globe:
+      st.subheader("Interactive 3D Billionaires Globe")
+      selected_iso_highlight = st.session_state.get('selected_country_iso_for_globe_highlight')
+      current_lon = st.session_state.get('target_lon', 0)
+      current_lat = st.session_state.get('target_lat', 20)
+      current_segment_order = globe_segment_order_with_others if selected_iso_highlight else base_segment_order
+      globe_geometry_level = geometry_level_for_viewport("globe")
+
+
+
+
+      def build_globe_figure():
+          # Copied because the highlight column is written below; the summary has one row per country
+          data_for_globe_plot = billionaire_summary_data.dropna(subset=['iso_alpha']).copy()
+          if data_for_globe_plot.empty:
+              return None
+          color_column_for_globe = 'billionaire_segment'
+          if selected_iso_highlight:
+              color_column_for_globe = 'display_segment_globe'
+              data_for_globe_plot[color_column_for_globe] = "Other Countries"
+              selected_country_actual_segment_series = data_for_globe_plot.loc[data_for_globe_plot['iso_alpha'] == selected_iso_highlight, 'billionaire_segment']
+              if not selected_country_actual_segment_series.empty:
+                  actual_segment = selected_country_actual_segment_series.iloc[0]
+                  data_for_globe_plot.loc[data_for_globe_plot['iso_alpha'] == selected_iso_highlight, color_column_for_globe] = actual_segment
+          fig_globe = px.choropleth(
+              data_for_globe_plot,
+              locations="iso_alpha",
+              color=color_column_for_globe,
+              hover_name="country_name",
+              hover_data={"billionaire_count": True, color_column_for_globe: False, "billionaire_segment": True, "iso_alpha": False},
+              projection="orthographic",
+              color_discrete_map=color_map_segments,
+              category_orders={color_column_for_globe: current_segment_order}
+          )
+          fig_globe.update_layout(
+              height=600,
+              margin={"r":10,"t":10,"l":10,"b":10},
+              geo=dict(
+                  showland=True, landcolor="rgb(200, 200, 200)",
+                  showocean=True, oceancolor="rgb(100, 150, 200)",
+                  bgcolor='rgba(0,0,0,0)',
+                  projection=dict(
+                      type='orthographic',
+                      scale=0.85,
+                      rotation=dict(lon=current_lon, lat=current_lat, roll=0)
+                  )
+              ),
+              paper_bgcolor='rgba(0,0,0,0)',
+              legend=dict(
+                  title_text='Billionaire Segments', orientation="v",
+                  yanchor="middle", y=0.5, xanchor="left", x=1.02,
+                  font=dict(size=12)
+              ),
+          )
+          apply_country_geometry(fig_globe, globe_geometry_level)
+          # Drag and the on-chart sliders rotate the globe in the browser without a rerun
+          return enable_client_rotation(
+              fig_globe, current_lon, current_lat,
+              uirevision=f'globe_view_lon{current_lon}_lat{current_lat}_sel{selected_iso_highlight}'
+          )
+
+
+
+
+      # Rotations come from a fixed set of country coordinates, so they are used as-is in the key;
+      # the geometry URL (None when the store is not served) tells bundled-shape figures from built-in ones
+      fig_globe = figure_cache.get_or_build(
+          figure_key("analysis-orthographic", selected_iso_highlight, (current_lon, current_lat), current_segment_order, data_version, geometry_url(globe_geometry_level)),
+          lambda: minimize_figure(build_globe_figure())
       )
-      st.plotly_chart(fig_globe, use_container_width=True, theme="streamlit", key="main_3d_globe")
-  else:
-      st.warning("Not enough data with valid ISO codes to display the 3D globe.")
+      if fig_globe is not None:
+          render_plotly_chart(
+              fig_globe, "analysis_globe", minimize=False, use_container_width=True, theme="streamlit", key=GLOBE_CHART_KEY,
+              on_select=on_country_select(GLOBE_CHART_KEY, country_lookup, select_country_on_globe), selection_mode="points"
+          )
+      else:
+          st.warning("Not enough data with valid ISO codes to display the 3D globe.")
 
 
 
 
-with col_filter_info:
-  st.subheader("Global View & Top 3 Leading Nations")
-  fixed_country_options_display = ["United States of America", "China", "India"]
-  country_options_for_select = ["Global Overview"] + fixed_country_options_display
-  default_selectbox_index = 0
-  current_selection_in_state = st.session_state.get('selected_country_for_info')
-  if current_selection_in_state and current_selection_in_state in country_options_for_select:
-      default_selectbox_index = country_options_for_select.index(current_selection_in_state)
-  elif not current_selection_in_state:
-      st.session_state.selected_country_for_info = "All Countries"
-      default_selectbox_index = country_options_for_select.index("Global Overview")
+  with col_filter_info:
+      st.subheader("Global View & Top 3 Leading Nations")
+      country_options_for_select = ["Global Overview"] + fixed_country_options_display
+      default_selectbox_index = 0
+      current_selection_in_state = st.session_state.get('selected_country_for_info')
+      if current_selection_in_state and current_selection_in_state in country_options_for_select:
+          default_selectbox_index = country_options_for_select.index(current_selection_in_state)
+      elif not current_selection_in_state:
+          st.session_state.selected_country_for_info = "Global Overview"
+          default_selectbox_index = country_options_for_select.index("Global Overview")
 
 
 
 
-  selected_country_name_from_box = st.selectbox(
-      "Focus globe on & view details for:",
-      options=country_options_for_select,
-      index=default_selectbox_index,
-      key="country_selector_fixed_top3"
-  )
+      st.selectbox(
+          "Focus globe on & view details for:",
+          options=country_options_for_select,
+          index=default_selectbox_index,
+          key="country_selector_fixed_top3",
+          on_change=focus_globe_on_country
+      )
 
 
 
 
-  if selected_country_name_from_box != st.session_state.get('selected_country_for_info'):
-      st.session_state.selected_country_for_info = selected_country_name_from_box
-      if selected_country_name_from_box == "Global Overview":
-          st.session_state.selected_country_iso_for_globe_highlight = None
-          st.session_state.target_lon = 0
-          st.session_state.target_lat = 20
-      else:
-          country_data_for_iso = billionaire_summary_data[billionaire_summary_data['country_name'] == selected_country_name_from_box]
-          if not country_data_for_iso.empty:
-              st.session_state.selected_country_iso_for_globe_highlight = country_data_for_iso.iloc[0]['iso_alpha']
+      current_display_country = st.session_state.get('selected_country_for_info')
+      if current_display_country == "Global Overview":
+          st.markdown("#### Global Overview")
+          total_global_billionaires = billionaire_summary_data['billionaire_count'].sum()
+          st.metric(label="Total Global Billionaires (in dataset)", value=f"{total_global_billionaires:,}")
+          industry_col_name = 'category'
+          global_main_industries_str = "N/A"
+          if industry_col_name in df_full_details.columns and not df_full_details[industry_col_name].dropna().empty:
+              top_global_industries = df_full_details[industry_col_name].value_counts().nlargest(3).index.tolist()
+              global_main_industries_str = ", ".join(top_global_industries) if top_global_industries else "N/A"
           else:
-              st.session_state.selected_country_iso_for_globe_highlight = None
-          coords = COUNTRY_COORDS_FOR_GLOBE.get(selected_country_name_from_box, {"lon": 0, "lat": 20})
-          st.session_state.target_lon = coords['lon']
-          st.session_state.target_lat = coords['lat']
-      st.rerun()
+              global_main_industries_str = f"Industry data not sufficiently available or column '{industry_col_name}' not found globally."
+          st.markdown(f"**Dominant Global Industries (Top 3):** {global_main_industries_str}")
+          global_analysis = ANALYSIS_TEXTS.get("All Countries", "Global analysis text not available.")
+          st.markdown("---")
+          st.markdown(global_analysis)
+      elif current_display_country:
+          country_details_row = billionaire_summary_data[billionaire_summary_data['country_name'] == current_display_country]
+          if not country_details_row.empty:
+              country_details = country_details_row.iloc[0]
+              total_billionaires = country_details['billionaire_count']
+              st.markdown(f"#### {current_display_country}")
+              st.metric(label="Total Billionaires", value=f"{total_billionaires:,}")
+              industry_col_name = 'category'
+              main_industries_str = "N/A"
+              if industry_col_name in df_full_details.columns:
+                  country_billionaires_df = df_full_details[df_full_details['country_name'] == current_display_country]
+                  if not country_billionaires_df.empty and not country_billionaires_df[industry_col_name].dropna().empty:
+                      top_industries = country_billionaires_df[industry_col_name].value_counts().nlargest(3).index.tolist()
+                      main_industries_str = ", ".join(top_industries) if top_industries else "N/A"
+                  else:
+                      main_industries_str = "Industry data not available."
+              else:
+                  main_industries_str = f"Industry column '{industry_col_name}' not found."
+              st.markdown(f"**Main Industries:** {main_industries_str}")
+              country_analysis = ANALYSIS_TEXTS.get(current_display_country, "No specific analysis text available for this country.")
+              st.markdown("---")
+              st.markdown(country_analysis)
+          else:
+              st.info("Details for the selected country could not be found. Please select 'Global Overview' or another country.")
+      else:
+          st.info("Select a country from the dropdown to view its details and rotate the globe.")
 
 
 
 
-  current_display_country = st.session_state.get('selected_country_for_info')
-  if current_display_country == "Global Overview":
-      st.markdown("#### Global Overview")
-      total_global_billionaires = billionaire_summary_data['billionaire_count'].sum()
-      st.metric(label="Total Global Billionaires (in dataset)", value=f"{total_global_billionaires:,}")
-      industry_col_name = 'category'
-      global_main_industries_str = "N/A"
-      if industry_col_name in df_full_details.columns and not df_full_details[industry_col_name].dropna().empty:
-          top_global_industries = df_full_details[industry_col_name].value_counts().nlargest(3).index.tolist()
-          global_main_industries_str = ", ".join(top_global_industries) if top_global_industries else "N/A"
-      else:
-          global_main_industries_str = f"Industry data not sufficiently available or column '{industry_col_name}' not found globally."
-      st.markdown(f"**Dominant Global Industries (Top 3):** {global_main_industries_str}")
-      global_analysis = ANALYSIS_TEXTS.get("All Countries", "Global analysis text not available.")
-      st.markdown("---")
-      st.markdown(global_analysis)
-  elif current_display_country:
-      country_details_row = billionaire_summary_data[billionaire_summary_data['country_name'] == current_display_country]
-      if not country_details_row.empty:
-          country_details = country_details_row.iloc[0]
-          total_billionaires = country_details['billionaire_count']
-          st.markdown(f"#### {current_display_country}")
-          st.metric(label="Total Billionaires", value=f"{total_billionaires:,}")
-          industry_col_name = 'category'
-          main_industries_str = "N/A"
-          if industry_col_name in df_full_details.columns:
-              country_billionaires_df = df_full_details[df_full_details['country_name'] == current_display_country]
-              if not country_billionaires_df.empty and not country_billionaires_df[industry_col_name].dropna().empty:
-                  top_industries = country_billionaires_df[industry_col_name].value_counts().nlargest(3).index.tolist()
-                  main_industries_str = ", ".join(top_industries) if top_industries else "N/A"
-              else:
-                  main_industries_str = "Industry data not available."
-          else:
-              main_industries_str = f"Industry column '{industry_col_name}' not found."
-          st.markdown(f"**Main Industries:** {main_industries_str}")
-          country_analysis = ANALYSIS_TEXTS.get(current_display_country, "No specific analysis text available for this country.")
-          st.markdown("---")
-          st.markdown(country_analysis)
-      else:
-          st.info("Details for the selected country could not be found. Please select 'All Countries' or another country.")
-  else:
-      st.info("Select a country from the dropdown to view its details and rotate the globe.")
+render_globe_section()
 
 
 
@@ -535,165 +610,162 @@ with header_left:
 
 
 # Use pre-processed data
-billionaires = df_full_details.copy()
-top_industries = billionaires['category'].value_counts().nlargest(6).index.tolist()
-custom_industries = ["All Industries"] + top_industries
-left, right = st.columns(2)
+# Named for the donut alone: the radar section below rebinds top_industries, and fragment reruns read these globals
+donut_industries = df_full_details['category'].value_counts().nlargest(6).index.tolist()
+donut_industry_options = ["All Industries"] + donut_industries
+# Industry selector and donut; the section reruns on its own when the industry changes
+@st.fragment
+def render_wealth_sources_section():
+  left, right = st.columns(2)
 
 
 
 
-with left:
-  st.markdown("Please select an industry from the dropdown menu to view its representation on the pie donut chart.")
-  selected = st.selectbox("Select Industry:", options=custom_industries, key="industry_selector")
-  if selected == "All Industries":
-      selected_industries = top_industries
-  else:
-      selected_industries = [selected]
+  with left:
+      st.markdown("Please select an industry from the dropdown menu to view its representation on the pie donut chart.")
+      selected = st.selectbox("Select Industry:", options=donut_industry_options, key="industry_selector")
+      if selected == "All Industries":
+          selected_industries = donut_industries
+      else:
+          selected_industries = [selected]
    
-  if selected_industries:
-      df = billionaires[billionaires['category'].isin(selected_industries)]
-  else:
-      df = billionaires.copy()
-  total_billionaires = len(df)
-  st.markdown(f"""
+      # Only the two label columns of the selected rows are taken; the loaded frame is never copied
+      in_selection = df_full_details['category'].isin(selected_industries)
+      donut_labels = df_full_details.loc[in_selection, [col for col in ('self_made_label', 'status_label') if col in df_full_details.columns]]
+      total_billionaires = len(donut_labels)
+      st.markdown(f"""
        #### Total Billionaires: {total_billionaires}""")
-  industry_descriptions = {
-      "All Industries": """
+      industry_descriptions = {
+          "All Industries": """
 **All Industries:**
 This pie donut chart provides a detailed view of billionaire wealth sources in 2023 across the top six industries, breaking down the distribution between self-made and not self-made billionaires. Within each group, it highlights key subcategories — entrepreneur, inherited, and others — offering insight into whether fortunes were built through business ventures, family inheritance, or other sources like investments or partnerships.
 """,
-      "Finance & Investments": """
+          "Finance & Investments": """
 **Finance & Investments:**
 This pie donut chart illustrates billionaire wealth sources in 2023 within the Finance & Investments industry, showing the division between self-made (74.29%) and not self-made (25.8%) billionaires, with subcategories: entrepreneur (42.39%, 37.5%), inherited (34.42%, 30.21%), and others (23.19%, 32.29%). Entrepreneur remains the most common source in both groups, while others appear slightly more prominent among not self-made billionaires.
 """,
-      "Manufacturing": """
+          "Manufacturing": """
 **Manufacturing:**
 This pie donut chart illustrates billionaire wealth sources in 2023 within the Manufacturing industry, showing the division between self-made (72.5%) and not self-made (27.5%) billionaires, with subcategories: entrepreneur (59.15%, 52.81%), inherited (26.38%, 35.96%), and others (14.47%, 11.24%). Entrepreneur is the dominant source in both groups, while inherited wealth is more prominent among not self-made billionaires.
 """,
-      "Technology": """
+          "Technology": """
 **Technology:**
 This pie donut chart illustrates billionaire wealth sources in 2023 within the Technology industry, showing the division between self-made (93%) and not self-made (7%) billionaires, with subcategories: entrepreneur (63.01%, 40.91%), inherited (21.23%, 36.36%), and others (15.75%, 22.73%). The chart highlights a dominant presence of self-made entrepreneurs, underscoring the industry's strong link to innovation and startup culture.
 """,
-      "Fashion & Retail": """
+          "Fashion & Retail": """
 **Fashion & Retail:**
 This pie donut chart illustrates billionaire wealth sources in 2023 within the Fashion & Retail industry, showing the division between self-made (59.89%) and not self-made (40.2%) billionaires, with subcategories: entrepreneur (43.4%, 46.73%), inherited (38.36%, 25.23%), and others (18.24%, 28.04%). Entrepreneur is the top source in both groups, while inherited wealth is more prominent among self-made billionaires compared to others.
 """,
-      "Food & Beverage": """
+          "Food & Beverage": """
 **Food & Beverage:**
 This pie donut chart illustrates billionaire wealth sources in 2023 within the Food & Beverage industry, showing the division between self-made (51.49%) and not self-made (48.6%) billionaires, with subcategories: entrepreneur (49.54%, 42.72%), inherited (34.86%, 28.16%), and others (15.6%, 29.13%). Entrepreneur is the leading source in both groups, while the not self-made side shows a stronger presence of “others” compared to self-made billionaires.
 """,
-      "Healthcare": """
+          "Healthcare": """
 **Healthcare:**
 This pie donut chart illustrates billionaire wealth sources in 2023 within the Healthcare industry, showing the division between self-made (72.6%) and not self-made (27.4%) billionaires, with subcategories: entrepreneur (50%, 56.36%), inherited (28.77%, 29.09%), and others (21.23%, 14.55%). Entrepreneur is the leading source in both groups, while inherited wealth holds a notable share among not self-made billionaires.
 """
-  }
-  st.markdown(industry_descriptions.get(selected, ""))
+      }
+      st.markdown(industry_descriptions.get(selected, ""))
 
 
 
 
-with right:
-  # Check for the selfMade column
-  self_made_col = None
-  for col in billionaires.columns:
-      if col.lower() in ['selfmade', 'self_made']:
-          self_made_col = col
-          break
+  with right:
+      # Check for the labels derived from the selfMade and status columns at load
+      if 'self_made_label' not in donut_labels.columns:
+          st.error("Error: 'selfMade' column not found in the dataset. Please check the dataset or update column mappings.")
+          st.stop()
+      if 'status_label' not in donut_labels.columns:
+          st.error("Error: 'status' column not found in the dataset. Please check the dataset or update column mappings.")
+          st.stop()
 
 
 
 
-  if self_made_col is None:
-      st.error("Error: 'selfMade' column not found in the dataset. Please check the dataset or update column mappings.")
-      st.stop()
-
-
-
-
-  # Data Transformation
-  df['status'] = df['status'].replace({'D': 'Entrepreneur', 'U': 'Inherited'})
-  df['status'] = np.where(df['status'].isin(['E', 'R', 'N', 'Split Family Fortune']), 'Others', df['status'])
-  df['selfMade'] = df[self_made_col].map({True: 'Self-made', False: 'Not Self-made'}).fillna(df[self_made_col].astype(str))
-  # Outer Circle (Breakdown) Data
-  group_totals = df['selfMade'].value_counts(normalize=True).round(4)
-  breakdown = df.groupby(['selfMade', 'status']).size().reset_index(name='count')
-  breakdown['within_group'] = breakdown.groupby('selfMade')['count'].transform(lambda x: x / x.sum())
-  breakdown['scaled_value'] = breakdown.apply(
-      lambda row: row['within_group'] * group_totals.get(row['selfMade'], 0), axis=1
-  ) * 100
-  breakdown['display_pct'] = (breakdown['within_group'] * 100).round(2)
-  breakdown['label'] = breakdown.apply(
-      lambda row: f"{row['status']}: {row['display_pct']}%", axis=1
-  )
-  breakdown['segment_key'] = breakdown.apply(
-      lambda row: f"{row['status']} of {row['selfMade']}", axis=1
-  )
-  outer_labels = breakdown['label'].tolist()
-  outer_values = breakdown['scaled_value'].round(2).tolist()
-  outer_customdata = breakdown['segment_key'].tolist()
-  outer_colors = ["#fa938d", "#ffaea5", "#ffc9c2", "#51ccd0", "#8fd9db", "#b7e6e7"]
-  # Inner Circle Data
-  table3 = df.groupby('selfMade').size().reset_index(name='Frequency').rename(columns={'selfMade': 'Selfmade'})
-  table3['Percentage'] = round((table3['Frequency'] / table3['Frequency'].sum()) * 100, 2)
-  inner_labels = table3['Selfmade'].tolist()
-  inner_values = table3['Percentage'].tolist()
-  inner_colors = ["#e27f72", "#3d9b9d"]
+      # Outer Circle (Breakdown) Data
+      group_totals = donut_labels['self_made_label'].value_counts(normalize=True).round(4)
+      breakdown = donut_labels.groupby(['self_made_label', 'status_label']).size().reset_index(name='count')
+      breakdown['within_group'] = breakdown.groupby('self_made_label')['count'].transform(lambda x: x / x.sum())
+      breakdown['scaled_value'] = breakdown.apply(
+          lambda row: row['within_group'] * group_totals.get(row['self_made_label'], 0), axis=1
+      ) * 100
+      breakdown['display_pct'] = (breakdown['within_group'] * 100).round(2)
+      breakdown['label'] = breakdown.apply(
+          lambda row: f"{row['status_label']}: {row['display_pct']}%", axis=1
+      )
+      breakdown['segment_key'] = breakdown.apply(
+          lambda row: f"{row['status_label']} of {row['self_made_label']}", axis=1
+      )
+      outer_labels = breakdown['label'].tolist()
+      outer_values = breakdown['scaled_value'].round(2).tolist()
+      outer_customdata = breakdown['segment_key'].tolist()
+      outer_colors = ["#fa938d", "#ffaea5", "#ffc9c2", "#51ccd0", "#8fd9db", "#b7e6e7"]
+      # Inner Circle Data
+      table3 = donut_labels.groupby('self_made_label').size().reset_index(name='Frequency').rename(columns={'self_made_label': 'Selfmade'})
+      table3['Percentage'] = round((table3['Frequency'] / table3['Frequency'].sum()) * 100, 2)
+      inner_labels = table3['Selfmade'].tolist()
+      inner_values = table3['Percentage'].tolist()
+      inner_colors = ["#e27f72", "#3d9b9d"]
+
+
+
+
+      # Determine Text Color Based on Theme
+      text_color = "white" if st.get_option("theme.base") == "dark" else "black"
+      # Plot Pie Donut Chart
+      fig = go.Figure()
+      # Outer donut
+      fig.add_trace(go.Pie(
+          labels=outer_labels,
+          values=outer_values,
+          hole=0.55,
+          sort=False,
+          direction='clockwise',
+          rotation=0,
+          marker=dict(colors=outer_colors, line=dict(color='white', width=1)),
+          texttemplate="%{label}",
+          textposition='outside',
+          textfont=dict(size=14),
+          showlegend=False,
+          domain={'x': [0, 1], 'y': [0, 1]},
+          customdata=outer_customdata,
+          hovertemplate='%{label}<extra></extra>'
+      ))
+
+
+
+
+      # Inner donut trace
+      fig.add_trace(go.Pie(
+          labels=inner_labels,
+          values=inner_values,
+          hole=0,
+          sort=False,
+          direction='clockwise',
+          rotation=0,
+          marker=dict(colors=inner_colors, line=dict(color='white', width=1)),
+          texttemplate="<b>%{label}</b><br>%{percent}",
+          textposition='inside',
+          insidetextorientation='horizontal',
+          textfont=dict(size=12),
+          showlegend=False,
+          domain={'x': [0.225, 0.775], 'y': [0.225, 0.775]},
+          customdata=inner_labels,
+          hoverinfo='label+percent'
+      ))
+      fig.update_layout(
+          margin=dict(t=50, b=50, l=50, r=50),
+          height=380,
+          width=380,
+          paper_bgcolor='rgba(0,0,0,0)',
+          plot_bgcolor='rgba(0,0,0,0)'
+      )
+      render_plotly_chart(fig, "wealth_sources_donut", use_container_width=True)
 
 
 
 
-  # Determine Text Color Based on Theme
-  text_color = "white" if st.get_option("theme.base") == "dark" else "black"
-  # Plot Pie Donut Chart
-  fig = go.Figure()
-  # Outer donut
-  fig.add_trace(go.Pie(
-      labels=outer_labels,
-      values=outer_values,
-      hole=0.55,
-      sort=False,
-      direction='clockwise',
-      rotation=0,
-      marker=dict(colors=outer_colors, line=dict(color='white', width=1)),
-      texttemplate="%{label}",
-      textposition='outside',
-      textfont=dict(size=14),
-      showlegend=False,
-      domain={'x': [0, 1], 'y': [0, 1]},
-      customdata=outer_customdata,
-      hovertemplate='%{label}<extra></extra>'
-  ))
-
-
-
-
-  # Inner donut trace
-  fig.add_trace(go.Pie(
-      labels=inner_labels,
-      values=inner_values,
-      hole=0,
-      sort=False,
-      direction='clockwise',
-      rotation=0,
-      marker=dict(colors=inner_colors, line=dict(color='white', width=1)),
-      texttemplate="<b>%{label}</b><br>%{percent}",
-      textposition='inside',
-      insidetextorientation='horizontal',
-      textfont=dict(size=12),
-      showlegend=False,
-      domain={'x': [0.225, 0.775], 'y': [0.225, 0.775]},
-      customdata=inner_labels,
-      hoverinfo='label+percent'
-  ))
-  fig.update_layout(
-      margin=dict(t=50, b=50, l=50, r=50),
-      height=380,
-      width=380,
-      paper_bgcolor='rgba(0,0,0,0)',
-      plot_bgcolor='rgba(0,0,0,0)'
-  )
-  st.plotly_chart(fig, use_container_width=True)
+render_wealth_sources_section()
 
 
 # --- Bar and Radar Chart Section ---
@@ -735,7 +807,7 @@ if missing_cols:
 
 
 # Process data for bar and radar charts
-df = df_full_details.dropna(subset=required_cols)
+df = load_complete_rows(data_version, df_full_details, tuple(required_cols))
 top_industries = (
   df.groupby('category')['finalWorth']
   .sum()
@@ -758,33 +830,55 @@ industry_counts = (
   .unstack(fill_value=0)
   .reindex(index=selected_industries, columns=top_countries, fill_value=0)
 )
+industry_worth = (
+  df_filtered[df_filtered['country'].isin(top_countries)]
+  .groupby(['category', 'country'])['finalWorth']
+  .sum()
+  .unstack(fill_value=0)
+  .reindex(index=selected_industries, columns=top_countries, fill_value=0)
+)
 
 
 
 
-# Select country
-selected_country = st.selectbox("Select a country", top_countries, key="country_selector_bar_radar")
+# Country x industry profiles over all countries, for the similarity overlay
+similarity_data = build_country_similarity(df, data_version, "pages/04")
 
 
 
 
 # Radar chart function
-def plot_radar_chart(country):
-  values = industry_counts[country].tolist()
+def plot_radar_chart(country, neighbours=()):
   labels = selected_industries + [selected_industries[0]]
-  values = values + [values[0]]
   fig = go.Figure()
-  fig.add_trace(go.Scatterpolar(
-      r=values,
-      theta=labels,
-      fill='toself',
-      marker=dict(symbol='circle', size=6),
-      hovertemplate="Industry: %{theta}<br>Number of billionaires: %{r}<extra></extra>"
-  ))
+  if neighbours:
+      for name in [country] + [neighbour for neighbour, _ in neighbours]:
+          values = get_industry_shares(similarity_data, name, selected_industries)
+          values = values + [values[0]]
+          fig.add_trace(go.Scatterpolar(
+              r=values,
+              theta=labels,
+              fill='toself' if name == country else 'none',
+              name=name,
+              marker=dict(symbol='circle', size=6),
+              hovertemplate=f"{name}<br>Industry: %{{theta}}<br>Share of billionaires: %{{r:.1f}}%<extra></extra>"
+          ))
+      radial_max = max(max(trace.r) for trace in fig.data)
+  else:
+      values = industry_counts[country].tolist()
+      values = values + [values[0]]
+      fig.add_trace(go.Scatterpolar(
+          r=values,
+          theta=labels,
+          fill='toself',
+          marker=dict(symbol='circle', size=6),
+          hovertemplate="Industry: %{theta}<br>Number of billionaires: %{r}<extra></extra>"
+      ))
+      radial_max = max(values)
   fig.update_layout(
       template='plotly_white',
       polar=dict(
-          radialaxis=dict(visible=True, range=[0, max(values) + 5], color='#000'),
+          radialaxis=dict(visible=True, range=[0, radial_max + 5], color='#000'),
       ),
       title="",
       width=600,
@@ -795,6 +889,19 @@ def plot_radar_chart(country):
 
 
 
+# Industry shares of every top country and its most similar countries, for the bundle's overlay
+def similar_profiles():
+  profiles = {}
+  for country in top_countries:
+      neighbours = get_similar_countries(similarity_data, country)
+      profiles[country] = [(country, get_industry_shares(similarity_data, country, selected_industries))] + [
+          (f"{name} ({score:.2f})", get_industry_shares(similarity_data, name, selected_industries)) for name, score in neighbours
+      ]
+  return profiles
+
+
+
+
 # Bar chart function
 def plot_bar_chart(country):
   filtered_country_df = df_filtered[
@@ -827,12 +934,145 @@ def plot_bar_chart(country):
 
 
 
-# Layout: radar and bar charts side-by-side
-col1, col2 = st.columns(2)
-with col1:
-  st.plotly_chart(plot_radar_chart(selected_country), use_container_width=True)
-with col2:
-  st.plotly_chart(plot_bar_chart(selected_country), use_container_width=True)
+# Country inputs and charts; the section reruns on its own when they change
+@st.fragment
+def render_industry_section():
+  # Select country: the bundle switches countries in the browser, with each country's overlay built in
+  switch_in_browser = st.toggle("Switch countries instantly in the browser", value=True, key="radar_bar_browser_toggle")
+  show_similar_countries = st.checkbox("Overlay countries with a similar billionaire profile", value=True, key="radar_similar_toggle")
+  similar_countries = []
+  if not switch_in_browser:
+      selected_country = st.selectbox("Select a country", top_countries, key="country_selector_bar_radar")
+      if show_similar_countries:
+          similar_countries = get_similar_countries(similarity_data, selected_country)
+  if similar_countries:
+      st.caption("Most similar industry mix (cosine similarity): " + ", ".join(f"{name} ({score:.2f})" for name, score in similar_countries) + ". The radar shows each country's share of its own billionaires so profiles of different sizes can be compared.")
+  elif switch_in_browser and show_similar_countries:
+      st.caption("Each radar compares the country with the three countries whose industry mix is most similar (cosine similarity, in brackets). It shows each country's share of its own billionaires so profiles of different sizes can be compared.")
+
+
+
+
+  # Layout: one pre-built bundle for all top countries, or radar and bar charts side-by-side
+  if switch_in_browser:
+      industry_bundle = figure_cache.get_or_build(
+          figure_key("industry-bundle-similar" if show_similar_countries else "industry-bundle", segment_spec=top_countries, data_version=data_version),
+          lambda: minimize_figure(build_industry_bundle(industry_counts, industry_worth, similar_profiles() if show_similar_countries else None))
+      )
+      render_plotly_chart(industry_bundle, "industry_bundle", minimize=False, use_container_width=True)
+  else:
+      col1, col2 = st.columns(2)
+      with col1:
+          render_plotly_chart(plot_radar_chart(selected_country, similar_countries), "industry_radar", use_container_width=True)
+      with col2:
+          render_plotly_chart(plot_bar_chart(selected_country), "industry_bar", use_container_width=True)
+
+
+
+
+render_industry_section()
+
+
+# --- Age vs Net Worth Section ---
+st.markdown("<hr style='border: 2px solid gray;'>", unsafe_allow_html=True)
+st.markdown("""
+## Age Versus Net Worth""")
+st.markdown("How does age relate to net worth? The density map counts billionaires in each age and wealth band, while the point cloud shows every individual behind those counts. Narrow the view by country or industry to see whether fortunes peak early or keep compounding with age.")
+
+
+
+
+age_worth_bins = build_age_worth_bins(df_full_details, data_version, "pages/04 details")
+col_age_country, col_age_category = st.columns(2)
+with col_age_country:
+  age_worth_country = st.selectbox("Country:", age_worth_bins['countries'], key="age_worth_country_selector")
+with col_age_category:
+  age_worth_category = st.selectbox("Industry:", age_worth_bins['categories'], key="age_worth_category_selector")
+
+
+
+
+age_worth_hist = get_age_worth_histogram(age_worth_bins, age_worth_country, age_worth_category)
+ages, worths, names = get_age_worth_points(age_worth_bins, age_worth_country, age_worth_category)
+st.markdown(f"#### Billionaires With Known Age: {len(ages):,}")
+col_density, col_scatter = st.columns(2)
+with col_density:
+  render_plotly_chart(plot_age_worth_density(age_worth_hist), "age_worth_density", use_container_width=True)
+with col_scatter:
+  # Every point by default: Scattergl keeps a growing archive responsive and the budget scales with the points
+  total_points = len(ages)
+  if total_points > SCATTER_SAMPLE_POINTS and st.toggle(f"Plot a random sample of {SCATTER_SAMPLE_POINTS:,} points", key="age_worth_sample_toggle"):
+      ages, worths, names = sample_points(ages, worths, names, SCATTER_SAMPLE_POINTS)
+      st.caption(f"Showing {len(ages):,} of {total_points:,} billionaires (random sample)")
+  render_plotly_chart(
+      plot_age_worth_scatter(ages, worths, names), "age_worth_scatter",
+      budget=scatter_budget(len(ages)), use_container_width=True
+  )
+
+
+
+
+# --- Country Indicators Section ---
+st.markdown("<hr style='border: 2px solid gray;'>", unsafe_allow_html=True)
+st.markdown("""
+## Billionaires and the Economies Around Them""")
+st.markdown("Do richer, healthier or lower-tax countries produce more billionaires? Each country is reduced to one row of indicators, then compared with its billionaire density and the weight of billionaire wealth relative to GDP.")
+
+
+
+
+indicator_data = build_country_indicator_matrix(df_full_details, data_version, "pages/04 details")
+if indicator_data is None or len(indicator_data['countries']) < 3:
+  st.info("Country indicator data is not sufficiently available for this analysis.")
+else:
+  col_corr, col_indicator_scatter = st.columns(2)
+  with col_corr:
+      st.markdown(f"#### Correlation Matrix ({len(indicator_data['countries'])} countries)")
+      render_plotly_chart(plot_correlation_heatmap(indicator_data), "indicator_correlation", use_container_width=True)
+  with col_indicator_scatter:
+      col_x, col_y = st.columns(2)
+      with col_x:
+          indicator_x = st.selectbox("Country indicator:", list(INDICATOR_COLUMNS), format_func=FEATURE_LABELS.get, key="indicator_x_selector")
+      with col_y:
+          indicator_y = st.selectbox("Billionaire metric:", list(BILLIONAIRE_METRICS), format_func=FEATURE_LABELS.get, key="indicator_y_selector")
+      render_plotly_chart(plot_indicator_scatter(indicator_data, indicator_x, indicator_y), "indicator_scatter", use_container_width=True)
+
+
+
+
+# --- Citizenship vs Residence Section ---
+st.markdown("<hr style='border: 2px solid gray;'>", unsafe_allow_html=True)
+st.markdown("""
+## Where Billionaires Come From — And Where They Live""")
+st.markdown("A passport and a home address don't always match. This flow links each billionaire's country of citizenship (left) to the country they live in (right), revealing which places export fortunes and which attract them.")
+
+
+
+
+migration_flows = build_migration_flows(df_full_details, data_version, "pages/04 details")
+col_flow_dim, col_flow_value, col_flow_measure = st.columns(3)
+with col_flow_dim:
+  flow_dimension = st.selectbox(
+      "Filter by:", [ALL_OPTION] + [dim for dim in FLOW_DIMENSIONS if dim in migration_flows['slices']],
+      format_func=lambda dim: "No filter" if dim == ALL_OPTION else FLOW_DIMENSIONS[dim],
+      key="flow_dimension_selector"
+  )
+with col_flow_value:
+  flow_values = list(migration_flows['slices'][flow_dimension])
+  flow_value = st.selectbox("Value:", flow_values, key="flow_value_selector", disabled=flow_dimension == ALL_OPTION)
+with col_flow_measure:
+  flow_measure = st.radio("Measure:", ["count", "worth"], format_func={"count": "Number of billionaires", "worth": "Net worth"}.get, horizontal=True, key="flow_measure_selector")
+movers_only = st.checkbox("Only billionaires living outside their country of citizenship", value=True, key="flow_movers_only")
+
+
+
+
+flow_slice = get_migration_slice(migration_flows, flow_dimension, flow_value)
+fig_flows = plot_migration_sankey(migration_flows, flow_slice, measure=flow_measure, movers_only=movers_only)
+if fig_flows is not None:
+  render_plotly_chart(fig_flows, "migration_sankey", use_container_width=True)
+else:
+  st.info("No cross-border billionaires match this filter.")
 
 
 
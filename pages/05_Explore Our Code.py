@@ -1,7 +1,4 @@
 import streamlit as st
-import plotly.express as px
-import pandas as pd
-from streamlit_extras.stoggle import stoggle
 
 
 
@@ -0,0 +1,54 @@
+# Build the content-addressed asset store and its manifest.
+#
+#   python scripts/build_asset_store.py
+#
+# assets/manifest.json maps a logical name (the source path, derived/... for
+# built images, geo/... for country geometry) to one file plus its sha256 and
+# size. Media is moved into static/ as <stem>.<hash>.<ext>, so Streamlit static
+# serving gives every version its own URL; the dataset stays at its single
+# source path and is only hashed. Pages, Web/ scripts and loaders resolve names
+# through utils.store, so each piece of content has exactly one copy on disk
+# and one cache key.
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from build_image_assets import build_derivatives
+from utils.dataset import DATASET_NAME
+from utils.geometry import GEOMETRY_LEVELS, geometry_name
+from utils.store import ROOT_DIR, put_file, read_manifest, register_file, write_manifest
+
+
+# Served as-is from the store. A file dropped at its source path is moved in (the
+# store copy is the only one); with no new source the stored version is kept.
+STORE_MEDIA = ["image/nidula_profile.jpg", "image/intro_video.mp4"]
+# Written into the store by scripts/build_country_geometry.py; fetched by the browser
+# as choropleth geojson URLs instead of being embedded in figures
+STORE_GEOMETRY = [geometry_name(level) for level in GEOMETRY_LEVELS]
+# Tracked by hash at their source path
+STORE_DATA = [DATASET_NAME]
+
+
+def main():
+    previous = read_manifest()
+    manifest = {}
+    for name in STORE_DATA:
+        if (ROOT_DIR / name).exists():
+            register_file(manifest, name, ROOT_DIR / name)
+    for name in STORE_MEDIA + STORE_GEOMETRY:
+        source = ROOT_DIR / name
+        if source.is_file():
+            put_file(manifest, name, source)
+            source.unlink()
+        elif name in previous and (ROOT_DIR / previous[name]["file"]).exists():
+            manifest[name] = previous[name]
+        else:
+            print(f"skipping {name}: not found")
+    build_derivatives(manifest)
+    write_manifest(manifest)
+    for name, entry in sorted(manifest.items()):
+        print(f"{name:<45} {entry['sha256'][:12]} {entry['bytes'] / 1024:>8.1f} KB  {entry['file']}")
+
+
+if __name__ == '__main__':
+    main()
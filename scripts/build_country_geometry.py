@@ -0,0 +1,235 @@
+# Build the bundled multi-resolution country geometry into the asset store (static/).
+#
+# Source: Natural Earth admin-0 countries (public domain), as a GeoJSON file or
+# a shapefile (shapefiles need `pip install pyshp`). The 1:110m layer ships
+# inside the geopandas<1.0 wheel as datasets/naturalearth_lowres.
+#
+#   python scripts/build_country_geometry.py path/to/ne_admin0_countries.geojson \
+#       --supplement path/to/echarts-countries-js
+#
+# The 1:110m layer has no outline for small states that hold billionaires in the
+# dataset (Monaco, Singapore, Hong Kong, ...). --supplement points at the
+# echarts-countries-js directory (inside the echarts-countries-pypkg sdist) and
+# adds the SUPPLEMENT_SHAPES below from it; the build fails if any is missing.
+#
+# Each level is simplified with Douglas-Peucker and its coordinates are rounded,
+# then published as geo/countries_<level>.geojson (ISO alpha-3 code as feature id)
+# straight into the store and assets/manifest.json; the store copy is the only one.
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.geometry import GEOMETRY_LEVELS, geometry_name
+from utils.store import put_bytes, read_manifest, write_manifest
+
+
+# Natural Earth leaves a few ISO codes as -99
+ISO_FALLBACKS = {"Kosovo": "XKX", "France": "FRA", "Norway": "NOR", "N. Cyprus": "CYN", "Somaliland": "SOL"}
+
+# ISO alpha-3 -> (echarts-countries-js file, feature name or None for every feature in the file)
+SUPPLEMENT_SHAPES = {
+    "AND": ("Andorra.js", None),
+    "BHR": ("Bahrain.js", None),
+    "BMU": ("Bermuda.js", None),
+    "CYM": ("Cayman_Islands.js", None),
+    "GGY": ("Guernsey.js", None),
+    "HKG": ("china.js", "香港"),
+    "LIE": ("Liechtenstein.js", None),
+    "MAC": ("china.js", "澳门"),
+    "MCO": ("Monaco.js", None),
+    "SGP": ("Singapore.js", None),
+    "TCA": ("Turks_and_Caicos_Islands.js", None),
+    "VGB": ("British_Virgin_Islands.js", None),
+}
+SUPPLEMENT_NAMES = {"HKG": "Hong Kong", "MAC": "Macao"}
+
+
+def read_features(source_path):
+    source_path = Path(source_path)
+    if source_path.suffix.lower() in ('.json', '.geojson'):
+        with open(source_path, encoding='utf-8') as f:
+            for feature in json.load(f)['features']:
+                props = {key.lower(): value for key, value in feature['properties'].items()}
+                yield props, feature['geometry']
+    else:
+        import shapefile
+        reader = shapefile.Reader(str(source_path.with_suffix('')))
+        for shape_record in reader.iterShapeRecords():
+            props = {key.lower(): value for key, value in shape_record.record.as_dict().items()}
+            yield props, shape_record.shape.__geo_interface__
+
+
+# --- echarts map files: a JS wrapper around registerMap(name, {...}) with compressed coordinates ---
+def _js_object_to_json(text):
+    # Quote bare object keys and turn !0/!1 into true/false; string contents are copied untouched
+    out = []
+    i = 0
+    key = re.compile(r'([A-Za-z_]\w*)(\s*:)')
+    while i < len(text):
+        c = text[i]
+        if c == '"':
+            j = i + 1
+            while text[j] != '"':
+                j += 2 if text[j] == '\\' else 1
+            out.append(text[i:j + 1])
+            i = j + 1
+            continue
+        match = key.match(text, i)
+        if match and (not out or not (out[-1][-1:].isalnum() or out[-1][-1:] == '_')):
+            out.append(f'"{match.group(1)}"{match.group(2)}')
+            i = match.end()
+        else:
+            out.append(c)
+            i += 1
+    return ''.join(out).replace(':!0', ':true').replace(':!1', ':false')
+
+
+def read_echarts_map(path):
+    text = Path(path).read_text(encoding='utf-8')
+    start = text.index(',', text.index('registerMap(')) + 1
+    collection, _ = json.JSONDecoder().raw_decode(_js_object_to_json(text[start:]).lstrip())
+    return collection
+
+
+def _decode_ring(encoded, offset, scale):
+    # Zigzag-encoded deltas, two characters per point, starting from the ring's offset
+    x, y = offset
+    ring = []
+    for i in range(0, len(encoded), 2):
+        dx = ord(encoded[i]) - 64
+        dy = ord(encoded[i + 1]) - 64
+        x += (dx >> 1) ^ -(dx & 1)
+        y += (dy >> 1) ^ -(dy & 1)
+        ring.append([x / scale, y / scale])
+    if ring and ring[0] != ring[-1]:
+        ring.append(ring[0])
+    return ring
+
+
+def decode_echarts_polygons(collection, feature_name=None):
+    scale = collection.get('UTF8Scale', 1024)
+    polygons = []
+    for feature in collection['features']:
+        if feature_name is not None and feature['properties'].get('name') != feature_name:
+            continue
+        geometry = feature['geometry']
+        if geometry['type'] == 'Polygon':
+            parts = [(geometry['coordinates'], geometry['encodeOffsets'])]
+        else:
+            parts = zip(geometry['coordinates'], geometry['encodeOffsets'])
+        for rings, offsets in parts:
+            if collection.get('UTF8Encoding'):
+                rings = [_decode_ring(ring, offset, scale) for ring, offset in zip(rings, offsets)]
+            polygons.append(rings)
+    return polygons
+
+
+def read_supplement(supplement_dir, known_isos):
+    supplement_dir = Path(supplement_dir)
+    maps = {}
+    for iso, (file_name, feature_name) in SUPPLEMENT_SHAPES.items():
+        if iso in known_isos:
+            continue
+        if file_name not in maps:
+            maps[file_name] = read_echarts_map(supplement_dir / file_name)
+        polygons = decode_echarts_polygons(maps[file_name], feature_name)
+        if not polygons:
+            raise SystemExit(f"{iso}: no shape named {feature_name!r} in {file_name}")
+        name = SUPPLEMENT_NAMES.get(iso, Path(file_name).stem.replace('_', ' '))
+        yield {'iso_a3': iso, 'name': name}, {'type': 'MultiPolygon', 'coordinates': polygons}
+
+
+def feature_iso(props):
+    iso = props.get('iso_a3')
+    if not iso or iso == '-99':
+        iso = ISO_FALLBACKS.get(props.get('name'), props.get('adm0_a3'))
+    return None if not iso or iso == '-99' else iso
+
+
+def simplify_ring(ring, tolerance):
+    points = np.asarray(ring, dtype=float)
+    if tolerance <= 0 or len(points) <= 4:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end <= start + 1:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = np.hypot(*segment)
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        i = int(distances.argmax())
+        if distances[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.extend([(start, split), (split, end)])
+    return points[keep]
+
+
+def simplify_polygon(polygon, tolerance, decimals):
+    rings = []
+    for ring in polygon:
+        simplified = np.round(simplify_ring(ring, tolerance), decimals)
+        # Drop consecutive duplicates introduced by rounding
+        simplified = simplified[np.r_[True, np.any(np.diff(simplified, axis=0) != 0, axis=1)]]
+        if len(simplified) >= 4:
+            rings.append(simplified.tolist())
+        elif not rings:
+            return None  # exterior collapsed: the holes go with it
+    return rings
+
+
+def build_level(features, tolerance, decimals):
+    output = []
+    for props, geometry in features:
+        polygons = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+        simplified = [p for p in (simplify_polygon(poly, tolerance, decimals) for poly in polygons) if p]
+        if not simplified:
+            # Keep tiny countries visible: fall back to the largest polygon, unsimplified
+            largest = max(polygons, key=lambda poly: len(poly[0]))
+            simplified = [simplify_polygon(largest, 0, decimals + 1) or largest]
+        iso = feature_iso(props)
+        if iso is None:
+            continue
+        output.append({
+            'type': 'Feature',
+            'id': iso,
+            'properties': {'name': props.get('name')},
+            'geometry': {'type': 'MultiPolygon', 'coordinates': simplified},
+        })
+    return {'type': 'FeatureCollection', 'features': output}
+
+
+def main(source_path, supplement_dir=None):
+    features = list(read_features(source_path))
+    if supplement_dir is not None:
+        features.extend(read_supplement(supplement_dir, {feature_iso(props) for props, _ in features}))
+    manifest = read_manifest()
+    for level, spec in GEOMETRY_LEVELS.items():
+        collection = build_level(features, spec['tolerance'], spec['decimals'])
+        data = json.dumps(collection, separators=(',', ':')).encode('utf-8')
+        entry = put_bytes(manifest, geometry_name(level), data)
+        vertices = sum(len(ring) for feature in collection['features']
+                       for polygon in feature['geometry']['coordinates'] for ring in polygon)
+        print(f"{level:<10} {len(collection['features']):>4} countries {vertices:>7} vertices {len(data) / 1024:>8.1f} KB  {entry['file']}")
+    # Replaces the previous levels' blobs
+    write_manifest(manifest)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the bundled country geometry levels.")
+    parser.add_argument("source", help="Natural Earth admin-0 countries (.geojson/.json or .shp)")
+    parser.add_argument("--supplement", metavar="DIR", help="echarts-countries-js directory with the small states")
+    args = parser.parse_args()
+    main(args.source, args.supplement)
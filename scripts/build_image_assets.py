@@ -0,0 +1,82 @@
+# Build the resized image derivatives into the asset store (static/).
+#
+#   python scripts/build_image_assets.py
+#
+# Every source listed in utils.images.IMAGE_ASSETS is cropped to its variant's
+# aspect ratio, resized to the displayed size (never upscaled), optionally
+# masked to a circle, and stored as WebP and/or JPEG under derived/<stem>.<variant>.<ext>.
+# scripts/build_asset_store.py runs this as part of the full store build.
+import io
+import sys
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageOps
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.images import IMAGE_ASSETS, IMAGE_VARIANTS, derivative_name
+from utils.store import ROOT_DIR, put_bytes, read_manifest, write_manifest
+
+
+def target_size(image, spec):
+    width, height = (side * spec['scale'] for side in spec['size'])
+    shrink = min(1.0, image.width / width, image.height / height)
+    return max(1, round(width * shrink)), max(1, round(height * shrink))
+
+
+def circle_mask(size, supersample=4):
+    # Draw large and shrink, so the edge is anti-aliased
+    mask = Image.new('L', (size[0] * supersample, size[1] * supersample), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, mask.width - 1, mask.height - 1), fill=255)
+    return mask.resize(size, Image.LANCZOS)
+
+
+def build_variant(image, spec):
+    image = ImageOps.fit(image.convert('RGBA'), target_size(image, spec), Image.LANCZOS)
+    if spec['circle']:
+        alpha = Image.new('L', image.size, 0)
+        alpha.paste(image.getchannel('A'), mask=circle_mask(image.size))
+        image.putalpha(alpha)
+    return image
+
+
+def encode_variant(image, fmt, quality):
+    buffer = io.BytesIO()
+    if fmt == 'jpeg':
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        background.save(buffer, 'JPEG', quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(buffer, 'WEBP', quality=quality, method=6)
+    return buffer.getvalue()
+
+
+def build_derivatives(manifest):
+    total_source = total_built = 0
+    for source, variant in IMAGE_ASSETS.items():
+        source_path = ROOT_DIR / source
+        if not source_path.exists():
+            print(f"skipping {source}: not found")
+            continue
+        spec = IMAGE_VARIANTS[variant]
+        with Image.open(source_path) as image:
+            built = build_variant(image, spec)
+        sizes = []
+        for fmt in spec['formats']:
+            entry = put_bytes(manifest, derivative_name(source, variant, fmt), encode_variant(built, fmt, spec['quality']))
+            sizes.append(entry['bytes'])
+        total_source += source_path.stat().st_size
+        total_built += sizes[0]
+        print(f"{source:<32} {variant:<10} {built.width}x{built.height:<5} "
+              f"{source_path.stat().st_size / 1024:>8.1f} KB -> " + " / ".join(f"{size / 1024:.1f} KB" for size in sizes))
+    if total_built:
+        print(f"total {total_source / 1024:.1f} KB -> {total_built / 1024:.1f} KB ({total_source / total_built:.1f}x smaller)")
+
+
+def main():
+    manifest = read_manifest()
+    build_derivatives(manifest)
+    write_manifest(manifest)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+# Refresh the bundled Lottie animations in assets/lottie/ from their sources.
+#
+#   python scripts/fetch_lottie_animations.py
+#
+# The app itself never fetches animations; it only reads the files written here.
+import json
+import sys
+from pathlib import Path
+
+import requests
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.lottie import LOTTIE_ANIMATIONS, LOTTIE_DIR
+
+
+def main():
+    LOTTIE_DIR.mkdir(parents=True, exist_ok=True)
+    for name, spec in LOTTIE_ANIMATIONS.items():
+        if not spec.get('source'):
+            continue
+        response = requests.get(spec['source'], timeout=30)
+        response.raise_for_status()
+        animation = response.json()
+        data = json.dumps(animation, separators=(',', ':'))
+        if spec.get('max_bytes') and len(data) > spec['max_bytes']:
+            print(f"{name:<20} skipped: {len(data) / 1024:.1f} KB is over the {spec['max_bytes'] / 1024:.0f} KB cap")
+            continue
+        with open(LOTTIE_DIR / spec['file'], 'w', encoding='utf-8') as f:
+            f.write(data)
+        print(f"{name:<20} {len(data) / 1024:>8.1f} KB -> assets/lottie/{spec['file']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+# Build every shared artifact before the app accepts traffic, and report the time per stage.
+#
+#   python scripts/warm_up.py                                # warm and report; exit 1 if a stage failed
+#   python scripts/warm_up.py --serve [--server.port 8501]   # warm, then serve Introduction.py from this process
+#   python scripts/warm_up.py --serve --main Web/map.py      # same for a standalone Web/ script
+#
+# st.cache_resource / st.cache_data and the figure and base64 caches live in the
+# server process, so --serve warms them in that process and only then starts
+# Streamlit. Its health endpoint (/_stcore/health) does not answer until the
+# server is listening, so a readiness probe on it passes only after warm-up.
+# Pages are warmed by running them once headlessly, which fills the same caches
+# a first visitor would: the dataset, country summary, age/worth cube and the
+# default figures. Views behind a widget that build their own cached data (the
+# US states and globe views of Web/map.py) are opened as well. By default the
+# main script and its pages/ are warmed, each page opened through the main
+# script as a visitor would; the Web/ scripts are separate apps and are only
+# warmed when served with --main. Options not listed here are passed on to
+# `streamlit run`.
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+from utils.base64_cache import get_base64_cache
+from utils.dataset import dataset_path, dataset_version
+from utils.figure_cache import get_figure_cache
+from utils.geometry import GEOMETRY_LEVELS, load_country_geometry
+from utils.images import IMAGE_ASSETS, image_derivative
+from utils.lottie import LOTTIE_ANIMATIONS, load_lottie
+from utils.static_assets import stored_path
+from utils.store import logical_name, store_url
+
+PAGE_TIMEOUT = 300
+# Widget steps that open a page's other cached views, applied one after another after its first run
+PAGE_VIEWS = {
+    "Web/map.py": [
+        lambda app: app.button(key="us_drilldown_button").click().run(),
+        lambda app: app.radio(key="map_view_selector_sidebar_final_v13").set_value("3D Interactive Globe").run(),
+    ],
+}
+
+
+# --- Shared artifacts that do not belong to one page ---
+def warm_dataset():
+    if dataset_path() is None:
+        raise FileNotFoundError("dataset not found in the asset store or at its source path")
+    return f"version {dataset_version()}"
+
+
+def warm_geometry():
+    missing = [level for level in GEOMETRY_LEVELS if load_country_geometry(level) is None]
+    if missing:
+        raise FileNotFoundError(f"missing geometry levels: {', '.join(missing)}")
+    return f"{len(GEOMETRY_LEVELS)} levels"
+
+
+def warm_lottie():
+    loaded = sum(load_lottie(name) is not None for name in LOTTIE_ANIMATIONS)
+    return f"{loaded}/{len(LOTTIE_ANIMATIONS)} animations"
+
+
+def warm_media():
+    # Published files are served by their static URL; the rest are encoded into the base64 cache.
+    # Asked of the store directly: outside a script run media_src cannot tell whether static/ is served
+    sources = [image_derivative(ROOT / source) for source in IMAGE_ASSETS]
+    inlined = [source for source in sources if store_url(logical_name(source)) is None]
+    cache = get_base64_cache()
+    for source in inlined:
+        cache.encode(stored_path(source))
+    return f"{len(sources)} images, {len(inlined)} inlined"
+
+
+def page_stage(main_script, page):
+    def warm_page():
+        # Through the main script: what a page renders (and caches) can depend on it, e.g. static URLs
+        app = AppTest.from_file(str(ROOT / main_script), default_timeout=PAGE_TIMEOUT)
+        app.run()
+        if page != main_script and not app.exception:
+            app.switch_page(page).run()
+        charts = len(app.get('plotly_chart'))
+        for open_view in PAGE_VIEWS.get(page, []):
+            if app.exception:
+                break
+            open_view(app)
+            charts += len(app.get('plotly_chart'))
+        if app.exception:
+            raise RuntimeError(app.exception[0].value)
+        return f"{charts} charts"
+    return warm_page
+
+
+def default_pages(main_script):
+    # Only what the served app can reach: its entry script and the pages/ next to it
+    pages = [main_script]
+    pages_dir = (ROOT / main_script).parent / "pages"
+    if pages_dir.is_dir():
+        pages += sorted(path.relative_to(ROOT).as_posix() for path in pages_dir.glob("*.py"))
+    return pages
+
+
+def warm_up(main_script, pages):
+    stages = [("dataset", warm_dataset), ("geometry", warm_geometry), ("lottie", warm_lottie), ("media", warm_media)]
+    stages += [(f"page {Path(page).stem}", page_stage(main_script, page)) for page in pages]
+    failures = []
+    total_start = time.perf_counter()
+    print(f"{'stage':<44}{'ms':>9}  result")
+    for label, stage in stages:
+        start = time.perf_counter()
+        try:
+            result = stage()
+        except Exception as e:
+            failures.append(label)
+            result = f"FAILED: {e}"
+        print(f"{label[:43]:<44}{(time.perf_counter() - start) * 1000:>9.1f}  {result}")
+    stats = get_figure_cache().stats()
+    print(f"{'total':<44}{(time.perf_counter() - total_start) * 1000:>9.1f}  "
+          f"{stats['entries']} figures cached ({stats['bytes'] / 1024:,.0f} KB)")
+    return failures
+
+
+def serve(main_script, streamlit_args):
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", str(ROOT / main_script), *streamlit_args]
+    cli.main()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm the app's shared caches, optionally then serve it.")
+    parser.add_argument("--main", default="Introduction.py", help="script to serve, relative to the repo root")
+    parser.add_argument("--pages", nargs="+", help="pages of the main script to warm (default: the main script and its pages/)")
+    parser.add_argument("--serve", action="store_true", help="start the Streamlit server in this process once warm")
+    args, streamlit_args = parser.parse_known_args()
+    # Pages resolve media relative to the working directory, as under `streamlit run`
+    os.chdir(ROOT)
+    failures = warm_up(args.main, args.pages or default_pages(args.main))
+    if failures:
+        print(f"not ready, failed stages: {', '.join(failures)}")
+        sys.exit(1)
+    if args.serve:
+        serve(args.main, streamlit_args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+# Pages resolve images relative to the working directory, as under `streamlit run`
+os.chdir(ROOT)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from utils.age_worth import (
+    ALL_OPTION, SCATTER_BYTES_PER_POINT, build_age_worth_bins, get_age_worth_histogram, get_age_worth_points,
+    plot_age_worth_scatter, sample_points, scatter_budget
+)
+from utils.payload import DEFAULT_CHART_BUDGET, minimize_figure, payload_size
+
+
+def details():
+    return pd.DataFrame({
+        "country_name": ["France", "France", "India", "India", "India", None],
+        "category": ["Fashion", "Food", "Fashion", "Technology", "Technology", "Food"],
+        "personname": ["a", "b", "c", "d", "e", "f"],
+        "age": [70, 45, 52, 38, np.nan, 60],
+        "finalWorth": [200_000, 3_000, 1_500, 90_000, 2_000, 5_000],
+    })
+
+
+def test_bins_roll_up_into_all():
+    bins = build_age_worth_bins(details(), "age-worth-test", "test")
+    assert bins["countries"] == [ALL_OPTION, "France", "India"]
+    assert bins["categories"] == [ALL_OPTION, "Fashion", "Food", "Technology"]
+    # Rows without age or country are left out
+    assert get_age_worth_histogram(bins).sum() == 4
+    assert get_age_worth_histogram(bins, "India").sum() == 2
+    assert get_age_worth_histogram(bins, category="Fashion").sum() == 2
+    assert get_age_worth_histogram(bins, "France", "Food").sum() == 1
+    cube = bins["cube"]
+    assert np.array_equal(cube[0], cube[1:].sum(axis=0))
+    assert np.array_equal(cube[:, 0], cube[:, 1:].sum(axis=1))
+
+
+def test_points_follow_the_filters():
+    bins = build_age_worth_bins(details(), "age-worth-test", "test")
+    age, worth, names = get_age_worth_points(bins, "India", "Technology")
+    assert names.tolist() == ["d"] and age.tolist() == [38] and worth.tolist() == [90_000]
+    assert len(get_age_worth_points(bins)[0]) == 4
+
+
+def points(n):
+    age = np.arange(n, dtype=float) % 80 + 20
+    worth = np.arange(n, dtype=float) + 1000
+    names = np.array([f"person {i}" for i in range(n)])
+    return age, worth, names
+
+
+def test_sample_keeps_every_point_under_the_cap():
+    age, worth, names = points(100)
+    sampled = sample_points(age, worth, names, 100)
+    assert all(np.array_equal(a, b) for a, b in zip(sampled, (age, worth, names)))
+
+
+def test_sample_is_random_not_strided_and_stable():
+    age, worth, names = points(10_000)
+    _, worth_sample, names_sample = sample_points(age, worth, names, 3000)
+    assert len(worth_sample) == len(set(names_sample)) == 3000
+    # Rows stay aligned and in frame order
+    assert np.array_equal(worth_sample, np.array([float(n.split()[1]) + 1000 for n in names_sample]))
+    assert np.all(np.diff(worth_sample) > 0)
+    assert len(set(np.diff(worth_sample))) > 1
+    assert np.array_equal(sample_points(age, worth, names, 3000)[1], worth_sample)
+
+
+def test_full_scatter_fits_its_budget():
+    for n in (10, 3000, 20_000):
+        fig = plot_age_worth_scatter(*points(n))
+        assert len(fig.data[0].x) == n
+        assert payload_size(minimize_figure(fig)) <= scatter_budget(n)
+    assert scatter_budget(10) == DEFAULT_CHART_BUDGET
+    assert scatter_budget(20_000) == 20_000 * SCATTER_BYTES_PER_POINT
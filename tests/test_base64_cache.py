@@ -0,0 +1,60 @@
+import base64
+import os
+
+from utils.base64_cache import Base64Cache
+
+
+def write(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(bytes(range(256)) * (size // 256) + bytes(size % 256))
+    return path
+
+
+def encoded_size(size):
+    return 4 * -(-size // 3)
+
+
+def test_repeat_encode_is_a_hit(tmp_path):
+    path = write(tmp_path, "a.bin", 300)
+    cache = Base64Cache(max_bytes=10_000)
+    encoded = cache.encode(path)
+    assert base64.b64decode(encoded) == path.read_bytes()
+    assert cache.encode(path) is encoded
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1, "bytes": encoded_size(300)}
+
+
+def test_byte_budget_evicts_least_recently_used(tmp_path):
+    a, b, c = (write(tmp_path, f"{name}.bin", 300) for name in "abc")
+    cache = Base64Cache(max_bytes=2 * encoded_size(300))
+    cache.encode(a)
+    cache.encode(b)
+    cache.encode(a)
+    cache.encode(c)
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    assert stats["bytes"] <= cache.max_bytes
+    cache.encode(a)
+    assert cache.stats()["hits"] == 2
+    cache.encode(b)
+    assert cache.stats()["misses"] == 4
+
+
+def test_file_over_the_whole_budget_is_returned_but_not_cached(tmp_path):
+    path = write(tmp_path, "big.bin", 3000)
+    cache = Base64Cache(max_bytes=1000)
+    assert base64.b64decode(cache.encode(path)) == path.read_bytes()
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+
+def test_changed_file_is_encoded_again(tmp_path):
+    path = write(tmp_path, "a.bin", 300)
+    cache = Base64Cache(max_bytes=10_000)
+    cache.encode(path)
+    path.write_bytes(b"changed")
+    os.utime(path, ns=(1, 1))
+    assert base64.b64decode(cache.encode(path)) == b"changed"
+    assert cache.stats()["misses"] == 2
+
+
+def test_missing_file(tmp_path):
+    assert Base64Cache().encode(tmp_path / "missing.png") is None
@@ -0,0 +1,74 @@
+import functools
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+import utils.export as export
+from utils.export import export_rows
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "personName": [f"person {i}" for i in range(10)],
+        "finalWorth": np.arange(10, dtype=float) * 1000,
+        # Empty in the first chunk: the parquet schema must not settle on a null type
+        "source": [None] * 4 + [f"source {i}" for i in range(6)],
+    })
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(export, "iter_chunks", functools.partial(export.iter_chunks, chunk_rows=4))
+
+
+def download_bytes(data):
+    # What st.download_button does with the callable's result
+    return convert_data_to_bytes_and_infer_mime(data, unsupported_error=TypeError(type(data)))[0]
+
+
+def test_csv_writes_one_header_across_chunks(frame, small_chunks):
+    rows = np.array([9, 0, 5, 2, 7, 4])
+    exported = pd.read_csv(io.BytesIO(download_bytes(export_rows(frame, rows, ["personName", "source"], "CSV"))))
+    expected = frame.iloc[rows][["personName", "source"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(exported, expected)
+
+
+def test_empty_csv_keeps_the_header(frame):
+    assert download_bytes(export_rows(frame, np.array([], dtype=int), ["personName", "finalWorth"], "CSV")) == b"personName,finalWorth\n"
+
+
+def test_parquet_multi_chunk(frame, small_chunks):
+    pytest.importorskip("pyarrow")
+    rows = np.arange(len(frame))
+    exported = pd.read_parquet(io.BytesIO(download_bytes(export_rows(frame, rows, list(frame.columns), "Parquet"))))
+    assert exported["personName"].tolist() == frame["personName"].tolist()
+    assert exported["source"].tolist()[4:] == frame["source"].tolist()[4:]
+    assert exported["source"].isna().sum() == 4
+
+
+def test_empty_parquet_keeps_the_columns(frame):
+    pytest.importorskip("pyarrow")
+    data = download_bytes(export_rows(frame, np.array([], dtype=int), ["personName", "finalWorth"], "Parquet"))
+    exported = pd.read_parquet(io.BytesIO(data))
+    assert list(exported.columns) == ["personName", "finalWorth"]
+    assert exported.empty
+
+
+def test_excel(frame, small_chunks):
+    pytest.importorskip("openpyxl")
+    rows = np.array([1, 3, 5, 6, 8])
+    exported = pd.read_excel(io.BytesIO(download_bytes(export_rows(frame, rows, list(frame.columns), "Excel"))))
+    assert exported["personName"].tolist() == frame["personName"].iloc[rows].tolist()
+    assert exported["finalWorth"].tolist() == frame["finalWorth"].iloc[rows].tolist()
+    assert exported["source"].isna().tolist() == [True, True, False, False, False]
+
+
+def test_large_export_spills_to_disk(frame, monkeypatch):
+    monkeypatch.setattr(export, "SPOOL_MAX_BYTES", 64)
+    data = export_rows(frame, np.arange(len(frame)), list(frame.columns), "CSV")
+    assert data.raw._rolled
+    assert download_bytes(data).count(b"\n") == len(frame) + 1
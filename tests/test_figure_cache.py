@@ -0,0 +1,51 @@
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from utils.figure_cache import FigureCache, figure_key, rotation_bucket
+
+
+def builder(calls, value):
+    def build():
+        calls.append(value)
+        return go.Figure(go.Bar(y=[value]))
+    return build
+
+
+def test_hit_returns_a_fresh_copy_without_rebuilding():
+    cache, calls = FigureCache(max_entries=2), []
+    first = cache.get_or_build("a", builder(calls, 1))
+    first["data"][0]["y"] = [99]
+    second = cache.get_or_build("a", builder(calls, 2))
+    assert calls == [1]
+    assert second["data"][0]["y"] == [1]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache, calls = FigureCache(max_entries=2), []
+    cache.get_or_build("a", builder(calls, 1))
+    cache.get_or_build("b", builder(calls, 2))
+    cache.get_or_build("a", builder(calls, 1))
+    cache.get_or_build("c", builder(calls, 3))
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    cache.get_or_build("a", builder(calls, 1))
+    cache.get_or_build("b", builder(calls, 2))
+    assert calls == [1, 2, 3, 2]
+
+
+def test_missing_figure_is_not_cached():
+    cache = FigureCache()
+    assert cache.get_or_build("none", lambda: None) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_stats_count_serialized_bytes():
+    cache, fig = FigureCache(), go.Figure(go.Bar(y=[1, 2, 3]))
+    cache.get_or_build("a", lambda: fig)
+    assert cache.stats()["bytes"] == len(pio.to_json(fig, validate=False))
+
+
+def test_keys():
+    assert rotation_bucket(12.4, -7.6) == (10, -10)
+    assert figure_key("orthographic", segment_spec=["1-20"]) == ("orthographic", None, None, ("1-20",), None, None)
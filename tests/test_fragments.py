@@ -0,0 +1,59 @@
+# Fragments rerun on their own with the module globals left by the last full run, so a
+# fragment must render the same thing whether the whole page or only the fragment reruns.
+# AppTest only does full runs; run_fragment drives the script runner the way a fragment
+# rerun in the browser does.
+import functools
+
+import pytest
+from streamlit.testing.v1 import AppTest, local_script_runner
+
+from conftest import ROOT
+
+ANALYSIS_PAGE = "pages/04_Billionaires Analysis.py"
+
+
+def fragment_id(app, name):
+    for fid, wrapped in app._fragment_storage._fragments.items():
+        for cell in wrapped.__closure__ or ():
+            if getattr(cell.cell_contents, "__name__", None) == name:
+                return fid
+    raise LookupError(f"fragment {name} was not registered")
+
+
+def run_fragment(app, name):
+    rerun_data = local_script_runner.RerunData
+    local_script_runner.RerunData = functools.partial(
+        rerun_data, fragment_id_queue=[fragment_id(app, name)], is_fragment_scoped_rerun=True
+    )
+    try:
+        app.run()
+    finally:
+        local_script_runner.RerunData = rerun_data
+    return app
+
+
+def donut_total(app):
+    return [m.value for m in app.markdown if "Total Billionaires" in m.value]
+
+
+@pytest.fixture
+def analysis_page():
+    app = AppTest.from_file(str(ROOT / ANALYSIS_PAGE), default_timeout=300)
+    app.run()
+    assert not app.exception
+    return app
+
+
+@pytest.mark.parametrize("fragment", ["render_globe_section", "render_wealth_sources_section", "render_industry_section"])
+def test_fragment_reruns_alone(analysis_page, fragment):
+    run_fragment(analysis_page, fragment)
+    assert not analysis_page.exception, analysis_page.exception[0].value
+
+
+def test_donut_matches_full_run(analysis_page):
+    full_run_total = donut_total(analysis_page)
+    full_run_options = analysis_page.selectbox(key="industry_selector").options
+    assert full_run_total
+    run_fragment(analysis_page, "render_wealth_sources_section")
+    assert donut_total(analysis_page) == full_run_total
+    assert analysis_page.selectbox(key="industry_selector").options == full_run_options
@@ -0,0 +1,74 @@
+# Country geometry checked against the real billionaire summaries the pages draw,
+# not synthetic ISO codes: a single country without an outline in the bundle sends
+# the whole figure back to Plotly's built-in shapes.
+import json
+
+import plotly.graph_objects as go
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+import utils.geometry as geometry
+from utils.geometry import GEOMETRY_LEVELS, apply_country_geometry, available_iso_codes
+
+MAIN_SCRIPT = "Introduction.py"
+ANALYSIS_PAGE = "pages/04_Billionaires Analysis.py"
+MAP_PAGE = "Web/map.py"
+
+
+def choropleth_traces(app):
+    return [
+        trace
+        for chart in app.get("plotly_chart")
+        for trace in json.loads(chart.proto.spec)["data"]
+        if trace.get("type") == "choropleth"
+    ]
+
+
+@pytest.fixture(scope="module")
+def analysis_traces():
+    # Through the main script, as deployed: static/ is only served next to it
+    app = AppTest.from_file(str(ROOT / MAIN_SCRIPT), default_timeout=300)
+    app.run()
+    app.switch_page(ANALYSIS_PAGE).run()
+    assert not app.exception, app.exception[0].value
+    return choropleth_traces(app)
+
+
+@pytest.fixture(scope="module")
+def map_traces():
+    app = AppTest.from_file(str(ROOT / MAP_PAGE), default_timeout=300)
+    app.run()
+    assert not app.exception, app.exception[0].value
+    return choropleth_traces(app)
+
+
+@pytest.mark.parametrize("level", list(GEOMETRY_LEVELS))
+def test_every_summary_country_has_geometry(analysis_traces, map_traces, level):
+    summary_isos = {iso for trace in analysis_traces + map_traces for iso in trace["locations"]}
+    assert summary_isos
+    assert sorted(summary_isos - available_iso_codes(level)) == []
+
+
+def test_analysis_globe_uses_bundled_geometry(analysis_traces):
+    assert analysis_traces
+    for trace in analysis_traces:
+        assert trace["locationmode"] == "geojson-id"
+        assert trace["geojson"].startswith("app/static/countries_globe.")
+
+
+def test_standalone_web_script_keeps_builtin_shapes(map_traces):
+    # Run on its own, Web/map.py would look for Web/static/, which does not exist
+    assert map_traces
+    for trace in map_traces:
+        assert trace.get("locationmode") in (None, "ISO-3")
+        assert "geojson" not in trace
+
+
+def test_location_without_geometry_keeps_builtin_shapes(monkeypatch):
+    monkeypatch.setattr(geometry, "geometry_url", lambda level: "app/static/countries.geojson")
+    for level in GEOMETRY_LEVELS:
+        assert "ZZZ" not in available_iso_codes(level)
+        trace = apply_country_geometry(go.Figure(go.Choropleth(locations=["USA", "ZZZ"], z=[1, 2])), level).data[0]
+        assert trace.locationmode is None
+        assert trace.geojson is None
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from utils.indicators import FEATURE_LABELS, build_country_indicator_matrix, plot_indicator_scatter
+
+
+def details():
+    countries = ["A", "A", "B", "C", "C", "C", "D"]
+    per_country = {
+        "A": ("$1,000,000,000,000", 10_000_000, 100.0),
+        "B": ("$500,000,000,000", 5_000_000, 110.0),
+        "C": ("$2,000,000,000,000", 40_000_000, 120.0),
+        # No GDP: left out of the matrix
+        "D": (None, 1_000_000, 130.0),
+    }
+    frame = pd.DataFrame({
+        "country_name": countries,
+        "finalWorth": [10_000, 20_000, 5_000, 1_000, 2_000, 3_000, 4_000],
+        "gdp_country": [per_country[c][0] for c in countries],
+        "population_country": [per_country[c][1] for c in countries],
+        "cpi_country": [per_country[c][2] for c in countries],
+    })
+    for i, column in enumerate(["total_tax_rate_country", "gross_tertiary_education_enrollment", "life_expectancy_country"]):
+        frame[column] = frame["country_name"].map({"A": 30.0 + i, "B": 40.0 - i, "C": 35.0 + 2 * i, "D": 20.0})
+    return frame
+
+
+def test_country_features():
+    data = build_country_indicator_matrix(details(), "indicators-test", "test")
+    assert data["countries"] == ["A", "B", "C"]
+    assert data["features"] == list(FEATURE_LABELS)
+    features = dict(zip(data["features"], data["matrix"][data["countries"].index("A")]))
+    # 2 billionaires per 10M people; $30B of a $1T GDP
+    assert features["billionaire_density"] == 0.2
+    assert np.isclose(features["wealth_to_gdp"], 3.0)
+    assert features["gdp_country"] == 1e12
+
+
+def test_correlation_matches_the_matrix():
+    data = build_country_indicator_matrix(details(), "indicators-test", "test")
+    assert data["corr"].shape == (len(FEATURE_LABELS), len(FEATURE_LABELS))
+    assert np.allclose(data["corr"], np.corrcoef(data["matrix"], rowvar=False))
+    assert np.allclose(data["means"], data["matrix"].mean(axis=0))
+
+
+def test_trend_line_is_the_least_squares_fit():
+    data = build_country_indicator_matrix(details(), "indicators-test", "test")
+    fig = plot_indicator_scatter(data, "gdp_country", "cpi_country")
+    x = data["matrix"][:, data["features"].index("gdp_country")]
+    y = data["matrix"][:, data["features"].index("cpi_country")]
+    slope, intercept = np.polyfit(x, y, 1)
+    line = fig.data[1]
+    assert np.allclose(line.y, intercept + slope * np.asarray(line.x))
+
+
+def test_missing_columns():
+    assert build_country_indicator_matrix(details().drop(columns="cpi_country"), "indicators-test", "test-missing") is None
@@ -0,0 +1,20 @@
+import pandas as pd
+
+from utils.map_selection import build_country_lookup
+
+
+def summary(count):
+    return pd.DataFrame({
+        "iso_alpha": ["USA", "FRA"],
+        "country_name": ["United States", "France"],
+        "billionaire_count": [count, 40],
+        "billionaire_segment": ["700+", "21-40"],
+    })
+
+
+def test_lookups_from_different_sources_do_not_share_an_entry():
+    first = build_country_lookup(summary(754), "lookup-test", "first page")
+    second = build_country_lookup(summary(700), "lookup-test", "second page")
+    assert first["USA"]["billionaire_count"] == 754
+    assert second["USA"]["billionaire_count"] == 700
+    assert build_country_lookup(summary(0), "lookup-test", "first page") is first
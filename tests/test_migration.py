@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from utils.migration import build_migration_flows, get_migration_slice, plot_migration_sankey
+
+
+@pytest.fixture
+def flows():
+    frame = pd.DataFrame({
+        "countryofcitizenship": ["India", "India", "India", "France", "France", None],
+        "country": ["United States", "United States", "India", "Monaco", "France", "France"],
+        "finalWorth": [1_000, 2_000, 5_000, 7_000, 3_000, 9_000],
+        "category": ["Tech", "Food", "Tech", "Fashion", "Fashion", "Food"],
+        "selfMade": [False, False, True, False, False, True],
+    })
+    return build_migration_flows(frame, "migration-test", "test")
+
+
+def as_pairs(flows, flow_slice):
+    countries = flows["countries"]
+    return {
+        (countries[o], countries[d]): (c, w)
+        for o, d, c, w in zip(flow_slice["origin"], flow_slice["destination"], flow_slice["count"], flow_slice["worth"])
+    }
+
+
+def test_all_slice_sums_every_pair(flows):
+    assert flows["countries"] == ["France", "India", "Monaco", "United States"]
+    assert as_pairs(flows, get_migration_slice(flows)) == {
+        ("India", "United States"): (2, 3_000),
+        ("India", "India"): (1, 5_000),
+        ("France", "Monaco"): (1, 7_000),
+        ("France", "France"): (1, 3_000),
+    }
+
+
+def test_slices_per_dimension(flows):
+    assert sorted(flows["slices"]["category"]) == ["Fashion", "Food", "Tech"]
+    assert as_pairs(flows, get_migration_slice(flows, "category", "Tech")) == {
+        ("India", "United States"): (1, 1_000),
+        ("India", "India"): (1, 5_000),
+    }
+    assert as_pairs(flows, get_migration_slice(flows, "selfMade", "Not Self-made")) == {
+        ("India", "United States"): (2, 3_000),
+        ("France", "Monaco"): (1, 7_000),
+        ("France", "France"): (1, 3_000),
+    }
+
+
+def test_sankey_shows_movers_only(flows):
+    fig = plot_migration_sankey(flows, get_migration_slice(flows), measure="worth")
+    assert sorted(fig.data[0].link.value) == [3_000, 7_000]
+    stayers_only = get_migration_slice(flows, "selfMade", "Self-made")
+    assert plot_migration_sankey(flows, stayers_only) is None
+    assert plot_migration_sankey(flows, stayers_only, movers_only=False) is not None
@@ -0,0 +1,56 @@
+# Every chart a page can render, checked against its byte budget. Each scenario
+# drives a page through AppTest into one of its views and then checks the size
+# render_plotly_chart recorded for every chart that view built.
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+from utils.payload import chart_sizes, check_figure_budget, reset_chart_sizes
+
+ANALYSIS_PAGE = "pages/04_Billionaires Analysis.py"
+MAP_PAGE = "Web/map.py"
+
+
+def show_radar_and_bar(app):
+    app.toggle(key="radar_bar_browser_toggle").set_value(False).run()
+
+
+def show_globe(rotation_mode):
+    def interact(app):
+        app.radio(key="map_view_selector_sidebar_final_v13").set_value("3D Interactive Globe").run()
+        app.radio(key="globe_rotation_mode_selector").set_value(rotation_mode).run()
+    return interact
+
+
+def show_us_states(app):
+    app.button(key="us_drilldown_button").click().run()
+
+
+SCENARIOS = {
+    "analysis-default": (ANALYSIS_PAGE, None, {
+        "analysis_globe", "wealth_sources_donut", "industry_bundle", "age_worth_density", "age_worth_scatter",
+        "indicator_correlation", "indicator_scatter", "migration_sankey",
+    }),
+    "analysis-radar-bar": (ANALYSIS_PAGE, show_radar_and_bar, {"industry_radar", "industry_bar"}),
+    "map-2d": (MAP_PAGE, None, {"web_map_2D Flat Map"}),
+    "map-globe-browser": (MAP_PAGE, show_globe("In browser"), {"web_map_3D Interactive Globe"}),
+    "map-globe-server": (MAP_PAGE, show_globe("Server sliders"), {"web_map_3D Interactive Globe"}),
+    "map-us-states": (MAP_PAGE, show_us_states, {"web_map_2D Flat Map"}),
+}
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_charts_within_budget(scenario):
+    page, interact, expected = SCENARIOS[scenario]
+    app = AppTest.from_file(str(ROOT / page), default_timeout=300)
+    app.run()
+    if interact is not None:
+        # Only the charts of the view the interaction leads to
+        reset_chart_sizes()
+        interact(app)
+    assert not app.exception, app.exception[0].value
+    sizes = chart_sizes()
+    assert expected <= set(sizes), f"charts not rendered: {sorted(expected - set(sizes))}"
+    for label, size in sizes.items():
+        assert size['budget'] is not None, f"chart '{label}' has no budget"
+        check_figure_budget(label, size['bytes'], size['budget'])
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.similarity import build_country_similarity, get_industry_shares, get_similar_countries
+
+
+@pytest.fixture
+def similarity():
+    profiles = {
+        "A": {"Tech": 6, "Food": 2},
+        "B": {"Tech": 3, "Food": 1},
+        "C": {"Food": 5, "Energy": 5},
+        "D": {"Tech": 1},
+    }
+    rows = [(country, industry) for country, counts in profiles.items() for industry, n in counts.items() for _ in range(n)]
+    frame = pd.DataFrame(rows + [(None, "Tech")], columns=["country", "category"])
+    return build_country_similarity(frame, "similarity-test", "test")
+
+
+def test_profiles_and_cosine_similarity(similarity):
+    assert similarity["countries"] == ["A", "B", "C", "D"]
+    assert similarity["totals"].tolist() == [8, 4, 10, 1]
+    assert np.allclose(np.diag(similarity["similarity"]), 1)
+    a, b = similarity["country_index"]["A"], similarity["country_index"]["B"]
+    # Same industry mix at a different scale
+    assert np.isclose(similarity["similarity"][a, b], 1)
+
+
+def test_neighbours_skip_self_and_small_countries(similarity):
+    neighbours = get_similar_countries(similarity, "A", k=3, min_billionaires=2)
+    assert [country for country, _ in neighbours] == ["B", "C"]
+    assert neighbours[0][1] == pytest.approx(1)
+    assert [country for country, _ in get_similar_countries(similarity, "A", k=1, min_billionaires=1)] == ["B"]
+    assert get_similar_countries(similarity, "Z") == []
+
+
+def test_industry_shares_in_percent(similarity):
+    assert get_industry_shares(similarity, "C", ["Energy", "Food", "Tech", "Unknown"]) == [50.0, 50.0, 0.0, 0.0]
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.table import filter_rows, page_rows, sort_order
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "rank": [3, 1, 2, 5, 4, 6, 7],
+        "finalWorth": [50.0, np.nan, 70.0, 10.0, 70.0, 20.0, 30.0],
+    })
+
+
+def test_sort_order_is_stable_with_missing_values_last(frame):
+    order = sort_order(frame, "table-test", "test", "finalWorth", True)
+    assert order.tolist() == [3, 5, 6, 0, 2, 4, 1]
+    assert sort_order(frame, "table-test", "test", "finalWorth", False).tolist() == [2, 4, 0, 6, 5, 3, 1]
+
+
+def test_sort_order_is_shared_read_only(frame):
+    order = sort_order(frame, "table-test", "test", "rank", True)
+    assert sort_order(frame, "table-test", "test", "rank", True) is order
+    with pytest.raises(ValueError):
+        order[0] = 0
+
+
+def test_pages_cover_the_selection_once(frame):
+    rows = filter_rows(frame["rank"] != 2)
+    pages = [page_rows(frame, rows, "table-test", "test", "rank", True, page, 4) for page in (1, 2)]
+    assert [p.tolist() for p in pages] == [[1, 0, 4, 3], [5, 6]]
+    assert sorted(np.concatenate(pages).tolist()) == rows.tolist()
+
+
+def test_page_past_the_end_or_empty_selection_is_empty(frame):
+    rows = filter_rows(np.ones(len(frame), dtype=bool))
+    assert page_rows(frame, rows, "table-test", "test", "rank", True, 3, 4).size == 0
+    assert page_rows(frame, filter_rows(np.zeros(len(frame))), "table-test", "test", "rank", True, 1, 4).size == 0
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from utils.payload import DEFAULT_CHART_BUDGET
+
+
+# --- Shared bin grid (age in years, net worth as log10 of million USD) ---
+ALL_OPTION = "All"
+AGE_EDGES = np.arange(15, 110, 5)
+LOG_WORTH_EDGES = np.round(np.arange(3.0, 5.65, 0.1), 2)
+# The scatter plots every point (Scattergl), so its budget grows with the point count;
+# the density map stays within the fixed default budget at any size
+SCATTER_BYTES_PER_POINT = 40
+# Above this many points the page offers an explicit, labelled random sample
+SCATTER_SAMPLE_POINTS = 3000
+
+
+# --- Precompute one histogram per (country, category), including "All" rollups ---
+# Keyed by the dataset version and the caller's `source` name instead of hashing the frame;
+# the returned arrays are shared read-only
+@st.cache_resource(show_spinner=False)
+def build_age_worth_bins(_df, data_version, source, country_col='country_name', category_col='category', name_col='personname'):
+    valid = _df.dropna(subset=['age', 'finalWorth', country_col, category_col])
+    valid = valid[valid['finalWorth'] > 0]
+
+    countries = sorted(valid[country_col].unique())
+    categories = sorted(valid[category_col].unique())
+    # Code 0 is reserved for the "All" rollup on both axes
+    country_codes = pd.Categorical(valid[country_col], categories=countries).codes.astype(np.int32) + 1
+    category_codes = pd.Categorical(valid[category_col], categories=categories).codes.astype(np.int32) + 1
+
+    age = valid['age'].to_numpy(dtype=float)
+    worth = valid['finalWorth'].to_numpy(dtype=float)
+    age_idx = np.clip(np.digitize(age, AGE_EDGES) - 1, 0, len(AGE_EDGES) - 2)
+    worth_idx = np.clip(np.digitize(np.log10(worth), LOG_WORTH_EDGES) - 1, 0, len(LOG_WORTH_EDGES) - 2)
+
+    cube = np.zeros(
+        (len(countries) + 1, len(categories) + 1, len(AGE_EDGES) - 1, len(LOG_WORTH_EDGES) - 1),
+        dtype=np.int32
+    )
+    np.add.at(cube, (country_codes, category_codes, age_idx, worth_idx), 1)
+    cube[0] = cube[1:].sum(axis=0)
+    cube[:, 0] = cube[:, 1:].sum(axis=1)
+
+    return {
+        'countries': [ALL_OPTION] + countries,
+        'categories': [ALL_OPTION] + categories,
+        'cube': cube,
+        'age': age,
+        'worth': worth,
+        'names': valid[name_col].fillna('').to_numpy(dtype=str),
+        'country_codes': country_codes,
+        'category_codes': category_codes,
+    }
+
+
+# --- Lookups: no re-binning, only indexing into the precomputed arrays ---
+def get_age_worth_histogram(bins, country=ALL_OPTION, category=ALL_OPTION):
+    ci = bins['countries'].index(country)
+    ki = bins['categories'].index(category)
+    return bins['cube'][ci, ki]
+
+
+def get_age_worth_points(bins, country=ALL_OPTION, category=ALL_OPTION):
+    mask = np.ones(len(bins['age']), dtype=bool)
+    if country != ALL_OPTION:
+        mask &= bins['country_codes'] == bins['countries'].index(country)
+    if category != ALL_OPTION:
+        mask &= bins['category_codes'] == bins['categories'].index(category)
+    return bins['age'][mask], bins['worth'][mask], bins['names'][mask]
+
+
+# --- Figures ---
+def plot_age_worth_density(hist):
+    age_centers = (AGE_EDGES[:-1] + AGE_EDGES[1:]) / 2
+    worth_centers = (LOG_WORTH_EDGES[:-1] + LOG_WORTH_EDGES[1:]) / 2
+    tick_values = [3, 3.5, 4, 4.5, 5, 5.5]
+    fig = go.Figure(go.Heatmap(
+        x=age_centers,
+        y=worth_centers,
+        z=hist.T,
+        colorscale='Blues',
+        colorbar=dict(title='Billionaires'),
+        hovertemplate="Age: %{x:.0f}<br>log10 Net Worth: %{y:.2f}<br>Billionaires: %{z}<extra></extra>"
+    ))
+    fig.update_layout(
+        template='plotly_white',
+        xaxis_title='Age',
+        yaxis=dict(
+            title='Net Worth (Million USD)',
+            tickvals=tick_values,
+            ticktext=[f"{10 ** v:,.0f}" for v in tick_values]
+        ),
+        height=450,
+        margin=dict(t=30, b=40, l=40, r=20)
+    )
+    return fig
+
+
+def scatter_budget(n_points):
+    return max(DEFAULT_CHART_BUDGET, n_points * SCATTER_BYTES_PER_POINT)
+
+
+def sample_points(age, worth, names, max_points, seed=0):
+    # Uniform random sample (same points on every rerun); a stride would follow the frame's sort order
+    if len(age) <= max_points:
+        return age, worth, names
+    keep = np.sort(np.random.default_rng(seed).choice(len(age), max_points, replace=False))
+    return age[keep], worth[keep], names[keep]
+
+
+def plot_age_worth_scatter(age, worth, names):
+    # Whole years and whole millions go out as 1- and 4-byte typed arrays instead of float64
+    age = age.astype(np.uint8)
+    if np.array_equal(worth, np.round(worth)):
+        worth = worth.astype(np.int32)
+    fig = go.Figure(go.Scattergl(
+        x=age,
+        y=worth,
+        mode='markers',
+        marker=dict(size=5, opacity=0.5, color='#1F78B4'),
+        text=names,
+        hovertemplate="<b>%{text}</b><br>Age: %{x:.0f}<br>Net Worth: %{y:,.0f}M<extra></extra>"
+    ))
+    fig.update_layout(
+        template='plotly_white',
+        xaxis_title='Age',
+        yaxis=dict(title='Net Worth (Million USD)', type='log'),
+        height=450,
+        margin=dict(t=30, b=40, l=40, r=20)
+    )
+    return fig
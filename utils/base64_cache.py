@@ -0,0 +1,67 @@
+import base64
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import streamlit as st
+
+
+DEFAULT_BASE64_CACHE_BYTES = 64 * 1024 * 1024
+
+
+# --- Bounded LRU of base64-encoded files, keyed by (path, mtime, size) and shared by every session ---
+class Base64Cache:
+    def __init__(self, max_bytes=DEFAULT_BASE64_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, path):
+        path = Path(path).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return encoded
+        try:
+            with open(path, "rb") as f:
+                encoded = base64.b64encode(f.read()).decode()
+        except OSError:
+            return None
+        with self._lock:
+            self.misses += 1
+            # A file larger than the whole budget is returned but never cached
+            if len(encoded) > self.max_bytes or key in self._entries:
+                return encoded
+            self._entries[key] = encoded
+            self.total_bytes += len(encoded)
+            while self.total_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+                self.evictions += 1
+        return encoded
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_base64_cache(max_bytes=DEFAULT_BASE64_CACHE_BYTES):
+    return Base64Cache(max_bytes)
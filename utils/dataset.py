@@ -0,0 +1,15 @@
+from utils.store import file_hash, resolve
+
+
+DATASET_NAME = "Billionaires_Statistics_Dataset.csv"
+
+
+# --- The one copy of the dataset, resolved through the asset store manifest ---
+def dataset_path():
+    return resolve(DATASET_NAME)
+
+
+# --- Dataset version token: the content hash, so identical data always shares cache entries ---
+def dataset_version(csv_path=None):
+    content_hash = file_hash(csv_path or dataset_path() or DATASET_NAME)
+    return content_hash[:16] if content_hash else "missing"
@@ -0,0 +1,78 @@
+import io
+import tempfile
+
+# Writers are only needed once a download is requested, so they are not imported with the page
+from utils.lazy import openpyxl, pa, pq
+
+
+EXPORT_CHUNK_ROWS = 50_000
+EXCEL_MAX_ROWS = 1_048_575
+SPOOL_MAX_BYTES = 16 * 1024 * 1024
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+
+# --- Selected rows in chunks, so only one chunk of the selection is ever materialized ---
+def iter_chunks(df, rows, columns, chunk_rows=EXPORT_CHUNK_ROWS):
+    column_positions = [df.columns.get_loc(column) for column in columns]
+    for start in range(0, len(rows), chunk_rows):
+        yield df.iloc[rows[start:start + chunk_rows], column_positions]
+
+
+def _write_csv(df, rows, columns, buffer):
+    if not len(rows):
+        df.iloc[:0][columns].to_csv(buffer, index=False)
+    for i, chunk in enumerate(iter_chunks(df, rows, columns)):
+        chunk.to_csv(buffer, header=i == 0, index=False)
+
+
+def _write_parquet(df, rows, columns, buffer):
+    writer = None
+    for chunk in iter_chunks(df, rows, columns):
+        if writer is None:
+            # Columns that are empty in the first chunk would infer a null type
+            schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+            schema = pa.schema([field.with_type(pa.string()) if pa.types.is_null(field.type) else field for field in schema])
+            writer = pq.ParquetWriter(buffer, schema)
+        writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    if writer is None:
+        pq.write_table(pa.Table.from_pandas(df.iloc[:0][columns], preserve_index=False), buffer)
+    else:
+        writer.close()
+
+
+def _write_excel(df, rows, columns, buffer):
+    # Write-only workbooks stream rows to disk instead of keeping cells in memory
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Billionaires")
+    sheet.append(list(columns))
+    for chunk in iter_chunks(df, rows, columns):
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append(row)
+    workbook.save(buffer)
+
+
+EXPORT_WRITERS = {"CSV": _write_csv, "Parquet": _write_parquet, "Excel": _write_excel}
+
+
+def available_export_formats(row_count):
+    formats = ["CSV", "Parquet"]
+    if openpyxl.available() and row_count <= EXCEL_MAX_ROWS:
+        formats.append("Excel")
+    return formats
+
+
+# --- Export the selection through a spooled file and hand st.download_button the file, not its bytes ---
+# The writers append chunk by chunk; past SPOOL_MAX_BYTES the file moves to disk, so a large
+# export is never held twice (a growing buffer plus the bytes copied out of it). Streamlit reads
+# the returned reader once, from the start, and the file goes away with it. The BufferedReader
+# wrapper is only there because download_button does not accept a SpooledTemporaryFile itself.
+def export_rows(df, rows, columns, fmt):
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='w+b')
+    EXPORT_WRITERS[fmt](df, rows, list(columns), spool)
+    spool.seek(0)
+    return io.BufferedReader(spool)
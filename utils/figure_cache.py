@@ -0,0 +1,67 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+import streamlit as st
+
+
+logger = logging.getLogger(__name__)
+
+
+# --- Bounded LRU of serialized figures, shared by every session in the process ---
+class FigureCache:
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key, build_figure):
+        with self._lock:
+            spec = self._entries.get(key)
+            if spec is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if spec is None:
+            fig = build_figure()
+            if fig is None:
+                return None
+            spec = pio.to_json(fig, validate=False)
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = spec
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            logger.debug("Figure cache miss for %s (%s)", key, self.stats())
+        # A fresh dict per call, so callers may update it without touching the cache
+        return json.loads(spec)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': sum(len(spec) for spec in self._entries.values()),
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache(max_entries=64):
+    return FigureCache(max_entries)
+
+
+# --- Key helpers ---
+def rotation_bucket(lon, lat, step=5):
+    return (round(lon / step) * step, round(lat / step) * step)
+
+
+def figure_key(projection, highlight_iso=None, rotation=None, segment_spec=(), data_version=None, geometry=None):
+    return (projection, highlight_iso, rotation, tuple(segment_spec), data_version, geometry)
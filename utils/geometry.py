@@ -0,0 +1,74 @@
+import json
+import logging
+
+import streamlit as st
+
+from utils.static_assets import published_url
+from utils.store import resolve
+
+
+logger = logging.getLogger(__name__)
+
+# --- Levels of detail, coarsest first (tolerance in degrees) ---
+GEOMETRY_LEVELS = {
+    "thumbnail": {"file": "countries_thumbnail.geojson", "tolerance": 0.6, "decimals": 1},
+    "map": {"file": "countries_map.geojson", "tolerance": 0.2, "decimals": 2},
+    "globe": {"file": "countries_globe.geojson", "tolerance": 0.05, "decimals": 2},
+}
+VIEWPORT_LEVELS = {"thumbnail": "thumbnail", "2d": "map", "globe": "globe"}
+
+
+def geometry_level_for_viewport(viewport, width_px=None):
+    # Small renders never need more than the thumbnail outlines
+    if width_px is not None and width_px < 400:
+        return "thumbnail"
+    return VIEWPORT_LEVELS.get(viewport, "map")
+
+
+# --- Published only into the asset store (scripts/build_country_geometry.py), under these names ---
+def geometry_name(level):
+    return "geo/" + GEOMETRY_LEVELS[level]["file"]
+
+
+@st.cache_resource(show_spinner=False)
+def load_country_geometry(level):
+    path = resolve(geometry_name(level))
+    if path is None:
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def geometry_url(level):
+    # Served from the asset store so the browser fetches and caches it once, outside the figure JSON
+    if not level:
+        return None
+    return published_url(geometry_name(level))
+
+
+def apply_country_geometry(fig, level):
+    # Swap Plotly's built-in world shapes for the bundled level when it is published;
+    # otherwise (or when any location has no outline there) keep locationmode='ISO-3'
+    return use_country_geometry(fig, level, geometry_url(level))
+
+
+def use_country_geometry(fig, level, url):
+    if fig is None or url is None:
+        return fig
+    traces = [trace for trace in fig.data if trace.type == "choropleth" and trace.locations is not None]
+    missing = sorted({iso for trace in traces for iso in trace.locations} - available_iso_codes(level))
+    if missing:
+        logger.warning("No %s geometry for %s; keeping Plotly's built-in shapes", level, ", ".join(missing))
+        return fig
+    for trace in traces:
+        trace.update(locationmode="geojson-id", featureidkey="id", geojson=url)
+    return fig
+
+
+@st.cache_resource(show_spinner=False)
+def available_iso_codes(level):
+    geometry = load_country_geometry(level)
+    return {feature["id"] for feature in geometry["features"]} if geometry else set()
@@ -0,0 +1,37 @@
+import numpy as np
+
+
+ROTATION_MODES = ("In browser", "Server sliders")
+
+
+# --- Client-side rotation: Plotly relayout steps run in the browser, no rerun ---
+def _rotation_slider(axis, label, start, stop, step, current, x):
+    values = np.arange(start, stop + step, step)
+    return dict(
+        active=int(np.abs(values - current).argmin()),
+        currentvalue=dict(prefix=f"{label}: ", suffix="°", font=dict(size=12)),
+        pad=dict(t=0, b=10),
+        len=0.45, x=x, xanchor='left', y=1.0, yanchor='bottom',
+        steps=[
+            dict(method='relayout', label=str(int(v)), args=[{f'geo.projection.rotation.{axis}': int(v)}])
+            for v in values
+        ],
+    )
+
+
+def enable_client_rotation(fig, lon=0, lat=20, step=15, uirevision='client-rotated-globe'):
+    if fig is None:
+        return None
+    margin_top = max(fig.layout.margin.t or 0, 70)
+    fig.update_layout(
+        # Dragging an orthographic globe in pan mode rotates it client-side
+        dragmode='pan',
+        # A stable revision keeps the user's rotation when Streamlit re-renders the chart
+        uirevision=uirevision,
+        sliders=[
+            _rotation_slider('lon', 'Longitude', -180, 180, step, lon, 0.0),
+            _rotation_slider('lat', 'Latitude', -90, 90, step, lat, 0.55),
+        ],
+        margin=dict(t=margin_top),
+    )
+    return fig
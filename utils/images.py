@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from utils.store import logical_name, resolve
+
+
+IMAGE_MIME_TYPES = {".webp": "image/webp", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png", ".mp4": "video/mp4"}
+
+# --- Derivative variants: CSS size on the page, rendered at 2x for high-DPI screens ---
+# Circles keep an alpha channel, so they are only written as WebP
+IMAGE_VARIANTS = {
+    "avatar": {"size": (180, 180), "scale": 2, "circle": True, "formats": ("webp",), "quality": 82},
+    "portrait": {"size": (300, 300), "scale": 2, "circle": False, "formats": ("webp", "jpeg"), "quality": 82},
+    "background": {"size": (1920, 1080), "scale": 1, "circle": False, "formats": ("webp", "jpeg"), "quality": 70},
+}
+IMAGE_ASSETS = {
+    **{f"image/{i}.png": "avatar" for i in range(1, 7)},
+    **{f"image/billionaire-{i}.png": "portrait" for i in range(1, 11)},
+    "image/background_intropage.jpg": "background",
+}
+
+
+# --- Logical store name of a derivative, e.g. derived/1.avatar.webp ---
+def derivative_name(source, variant, fmt):
+    extension = "jpg" if fmt == "jpeg" else fmt
+    return f"derived/{Path(source).stem}.{variant}.{extension}"
+
+
+# --- Built derivative for a source image, falling back to the original if it has not been built ---
+def image_derivative(source, fmt="webp"):
+    source = Path(source)
+    variant = IMAGE_ASSETS.get(logical_name(source))
+    if variant is None or fmt not in IMAGE_VARIANTS[variant]["formats"]:
+        return source
+    return resolve(derivative_name(source, variant, fmt)) or source
+
+
+def image_mime(path):
+    return IMAGE_MIME_TYPES.get(Path(path).suffix.lower(), "application/octet-stream")
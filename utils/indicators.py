@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+
+# --- Country-level features: two billionaire metrics followed by the country indicators ---
+BILLIONAIRE_METRICS = {
+    'billionaire_density': 'Billionaires per Million People',
+    'wealth_to_gdp': 'Billionaire Wealth to GDP (%)',
+}
+INDICATOR_COLUMNS = {
+    'gdp_country': 'GDP (USD)',
+    'cpi_country': 'Consumer Price Index',
+    'total_tax_rate_country': 'Total Tax Rate (%)',
+    'gross_tertiary_education_enrollment': 'Tertiary Education Enrollment (%)',
+    'life_expectancy_country': 'Life Expectancy (Years)',
+}
+FEATURE_LABELS = {**BILLIONAIRE_METRICS, **INDICATOR_COLUMNS}
+
+
+def _to_number(series):
+    # gdp_country is stored as text such as "$2,715,518,274,227"
+    if series.dtype == object or pd.api.types.is_string_dtype(series):
+        series = series.astype(str).str.replace(r'[$,\s]', '', regex=True)
+    return pd.to_numeric(series, errors='coerce')
+
+
+# --- One feature matrix and one correlation matrix, built once per dataset version and shared read-only ---
+# `source` stands in for the unhashed frame in the key
+@st.cache_resource(show_spinner=False)
+def build_country_indicator_matrix(_df, data_version, source, country_col='country_name'):
+    columns = ['finalWorth', 'population_country'] + list(INDICATOR_COLUMNS)
+    missing = [col for col in columns + [country_col] if col not in _df.columns]
+    if missing:
+        return None
+
+    numeric = _df[[country_col]].copy()
+    for col in columns:
+        numeric[col] = _to_number(_df[col])
+    grouped = numeric.groupby(country_col)
+    country_df = grouped[list(INDICATOR_COLUMNS) + ['population_country']].first()
+    country_df['billionaire_count'] = grouped.size()
+    country_df['total_worth'] = grouped['finalWorth'].sum()
+
+    country_df['billionaire_density'] = country_df['billionaire_count'] / (country_df['population_country'] / 1e6)
+    # finalWorth is in million USD
+    country_df['wealth_to_gdp'] = country_df['total_worth'] * 1e6 / country_df['gdp_country'] * 100
+    country_df = country_df[list(FEATURE_LABELS)].replace([np.inf, -np.inf], np.nan).dropna()
+
+    matrix = country_df.to_numpy(dtype=float)
+    return {
+        'countries': country_df.index.tolist(),
+        'features': list(FEATURE_LABELS),
+        'matrix': matrix,
+        'corr': np.corrcoef(matrix, rowvar=False),
+        'means': matrix.mean(axis=0),
+        'stds': matrix.std(axis=0),
+    }
+
+
+# --- Figures read straight from the cached matrices ---
+def plot_correlation_heatmap(indicator_data):
+    labels = [FEATURE_LABELS[f] for f in indicator_data['features']]
+    fig = go.Figure(go.Heatmap(
+        z=indicator_data['corr'],
+        x=labels,
+        y=labels,
+        zmin=-1, zmax=1,
+        colorscale='RdBu',
+        text=np.round(indicator_data['corr'], 2),
+        texttemplate="%{text}",
+        hovertemplate="%{y}<br>%{x}<br>r = %{z:.2f}<extra></extra>"
+    ))
+    fig.update_layout(
+        template='plotly_white',
+        height=500,
+        margin=dict(t=30, b=40, l=40, r=20),
+        xaxis_tickangle=-35,
+        yaxis_autorange='reversed'
+    )
+    return fig
+
+
+def plot_indicator_scatter(indicator_data, x_feature, y_feature):
+    features = indicator_data['features']
+    xi, yi = features.index(x_feature), features.index(y_feature)
+    x = indicator_data['matrix'][:, xi]
+    y = indicator_data['matrix'][:, yi]
+    r = indicator_data['corr'][yi, xi]
+    # Least-squares line from the cached moments: slope = r * sd_y / sd_x
+    x_std = indicator_data['stds'][xi]
+    slope = r * indicator_data['stds'][yi] / x_std if x_std else 0.0
+    intercept = indicator_data['means'][yi] - slope * indicator_data['means'][xi]
+    line_x = np.array([x.min(), x.max()])
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=x, y=y,
+        mode='markers',
+        text=indicator_data['countries'],
+        marker=dict(size=9, color='#1F78B4', opacity=0.75),
+        hovertemplate="<b>%{text}</b><br>%{x:,.2f}<br>%{y:,.2f}<extra></extra>",
+        showlegend=False
+    ))
+    fig.add_trace(go.Scatter(
+        x=line_x, y=intercept + slope * line_x,
+        mode='lines',
+        line=dict(color='#FF7F00', width=2),
+        name=f"Trend (r = {r:.2f})"
+    ))
+    fig.update_layout(
+        template='plotly_white',
+        xaxis_title=FEATURE_LABELS[x_feature],
+        yaxis_title=FEATURE_LABELS[y_feature],
+        height=500,
+        margin=dict(t=30, b=40, l=40, r=20),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
+    )
+    return fig
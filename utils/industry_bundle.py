@@ -0,0 +1,92 @@
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+
+# --- Radar + bar pair for every country in one figure, switched by a browser-side dropdown ---
+# similar_profiles maps a country to [(name, shares), ...], itself first; its radar then compares
+# shares of billionaires (%) with those countries instead of showing counts
+def build_industry_bundle(industry_counts, industry_worth, similar_profiles=None, height=500):
+    industries = list(industry_counts.index)
+    countries = list(industry_counts.columns)
+    if not industries or not countries:
+        return None
+    similar_profiles = similar_profiles or {}
+
+    fig = make_subplots(
+        rows=1, cols=2,
+        specs=[[{'type': 'polar'}, {'type': 'xy'}]],
+        horizontal_spacing=0.12
+    )
+    labels = industries + [industries[0]]
+    layouts = []
+    trace_country = []
+    for i, country in enumerate(countries):
+        profiles = similar_profiles.get(country)
+        if profiles:
+            for name, shares in profiles:
+                fig.add_trace(go.Scatterpolar(
+                    r=list(shares) + [shares[0]],
+                    theta=labels,
+                    fill='toself' if name == country else 'none',
+                    name=name,
+                    visible=i == 0,
+                    marker=dict(symbol='circle', size=6),
+                    hovertemplate=f"{name}<br>Industry: %{{theta}}<br>Share of billionaires: %{{r:.1f}}%<extra></extra>"
+                ), row=1, col=1)
+                trace_country.append(i)
+            radial_max = max(max(shares) for _, shares in profiles)
+        else:
+            counts = industry_counts[country].tolist()
+            fig.add_trace(go.Scatterpolar(
+                r=counts + [counts[0]],
+                theta=labels,
+                fill='toself',
+                name=country,
+                visible=i == 0,
+                showlegend=False,
+                marker=dict(symbol='circle', size=6),
+                hovertemplate="Industry: %{theta}<br>Number of billionaires: %{r}<extra></extra>"
+            ), row=1, col=1)
+            trace_country.append(i)
+            radial_max = max(counts)
+        worth = industry_worth[country].reindex(industries).fillna(0).sort_values(ascending=False)
+        fig.add_trace(go.Bar(
+            x=worth.index.tolist(),
+            y=worth.tolist(),
+            name=country,
+            visible=i == 0,
+            showlegend=False,
+            hovertemplate="Industry: %{x}<br>Total Net Worth: %{y:,.0f} Million USD<extra></extra>"
+        ), row=1, col=2)
+        trace_country.append(i)
+        layouts.append({
+            'polar.radialaxis.range': [0, radial_max + 5],
+            'xaxis.categoryarray': worth.index.tolist(),
+            'title.text': f"Billionaire Wealth and Number in {country}",
+        })
+
+    # Each button shows the traces of its own country: the radar (one or more), then the bar
+    buttons = []
+    for i, country in enumerate(countries):
+        visible = [owner == i for owner in trace_country]
+        buttons.append(dict(label=country, method='update', args=[{'visible': visible}, layouts[i]]))
+
+    fig.update_layout(
+        template='plotly_white',
+        height=height,
+        title=dict(text=layouts[0]['title.text'], x=0.5, xanchor='center'),
+        polar=dict(radialaxis=dict(visible=True, range=layouts[0]['polar.radialaxis.range'], color='#000')),
+        xaxis=dict(title='Industry', tickangle=-45, categoryorder='array', categoryarray=layouts[0]['xaxis.categoryarray']),
+        yaxis=dict(title='Total Net Worth (Million USD)'),
+        updatemenus=[dict(
+            type='dropdown',
+            buttons=buttons,
+            active=0,
+            showactive=True,
+            x=0, xanchor='left',
+            y=1.18, yanchor='top'
+        )],
+        legend=dict(x=0, xanchor='left', y=-0.25, yanchor='top', orientation='h'),
+        margin=dict(t=100)
+    )
+    return fig
@@ -0,0 +1,28 @@
+import importlib
+import importlib.util
+
+
+# --- Heavy modules imported on first attribute access instead of when a page or util module loads ---
+# importlib.import_module holds the import lock, so concurrent sessions resolve the same module once
+class LazyModule:
+    def __init__(self, name):
+        self.name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        # Only reached for names not set in __init__, i.e. the wrapped module's attributes
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self.name)
+        return getattr(module, attr)
+
+    def available(self):
+        return self._module is not None or importlib.util.find_spec(self.name) is not None
+
+
+# --- Shared proxies, used as e.g. `from utils.lazy import px` ---
+px = LazyModule("plotly.express")
+pycountry = LazyModule("pycountry")
+pa = LazyModule("pyarrow")
+pq = LazyModule("pyarrow.parquet")
+openpyxl = LazyModule("openpyxl")
@@ -0,0 +1,39 @@
+import json
+import logging
+
+import streamlit as st
+
+from utils.store import ROOT_DIR
+
+
+logger = logging.getLogger(__name__)
+
+LOTTIE_DIR = ROOT_DIR / "assets" / "lottie"
+
+# --- Animations shipped with the app; `source` is where scripts/fetch_lottie_animations.py refreshes them from ---
+LOTTIE_ANIMATIONS = {
+    "billionaire_intro": {
+        "file": "billionaire_intro.json",
+        "source": "https://lottie.host/362e9c68-2e7f-4f0c-a88c-28f6dd93af97/4ySes9wMJy.json",
+        "max_bytes": 512 * 1024,
+    },
+}
+
+
+# --- Parsed once per process and shared by every session; only ever read from disk ---
+@st.cache_resource(show_spinner=False)
+def load_lottie(name):
+    spec = LOTTIE_ANIMATIONS.get(name)
+    if spec is None:
+        return None
+    path = LOTTIE_DIR / spec["file"]
+    try:
+        size = path.stat().st_size
+        if spec.get("max_bytes") and size > spec["max_bytes"]:
+            logger.warning("Lottie animation %s is %d bytes, over its %d byte cap", name, size, spec["max_bytes"])
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Lottie animation %s is not bundled (%s); run scripts/fetch_lottie_animations.py", name, e)
+        return None
@@ -0,0 +1,42 @@
+import streamlit as st
+
+
+SELECTION_FIELDS = ('country_name', 'billionaire_count', 'billionaire_segment')
+
+
+# --- ISO code -> clicked-country details, built once per dataset version and shared read-only ---
+# The summary frame is not hashed, so `source` names which page's summary it is; pages/04 and
+# Web/map.py build theirs differently and would otherwise read each other's entry
+@st.cache_resource(show_spinner=False)
+def build_country_lookup(_summary_df, data_version, source, iso_col='iso_alpha'):
+    if _summary_df.empty or iso_col not in _summary_df.columns:
+        return {}
+    rows = _summary_df.dropna(subset=[iso_col])[[iso_col, *SELECTION_FIELDS]]
+    return {row[iso_col]: {field: row[field] for field in SELECTION_FIELDS} for row in rows.to_dict('records')}
+
+
+# --- ISO code of the first selected point of a chart rendered with on_select ---
+# Choropleth points carry it as `location`; otherwise it is the customdata value that is a known
+# code (figures minimized with keep_customdata keep that column, wherever it ends up)
+def selected_location(chart_key, country_lookup):
+    event = st.session_state.get(chart_key)
+    points = event.get('selection', {}).get('points') if event else None
+    if not points:
+        return None
+    point = points[0]
+    location = point.get('location')
+    if location:
+        return location
+    customdata = point.get('customdata')
+    if not isinstance(customdata, list):
+        return None
+    return next((value for value in customdata if isinstance(value, str) and value in country_lookup), None)
+
+
+# --- on_select callback: Streamlit runs it before the rerun, so that single run already sees the new state ---
+def on_country_select(chart_key, country_lookup, select_country):
+    def callback():
+        iso = selected_location(chart_key, country_lookup)
+        if iso in country_lookup:
+            select_country(iso, country_lookup[iso])
+    return callback
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+
+ALL_OPTION = "All"
+FLOW_DIMENSIONS = {'category': 'Industry', 'selfMade': 'Wealth Type'}
+SELF_MADE_LABELS = {True: 'Self-made', False: 'Not Self-made'}
+
+
+def _to_sparse(aggregated):
+    # COO layout: one entry per (citizenship, residence) pair that actually occurs
+    return {
+        'origin': aggregated.index.get_level_values('origin').to_numpy(dtype=np.int32),
+        'destination': aggregated.index.get_level_values('destination').to_numpy(dtype=np.int32),
+        'count': aggregated['count'].to_numpy(dtype=np.int64),
+        'worth': aggregated['worth'].to_numpy(dtype=float),
+    }
+
+
+# --- Sparse origin-destination count/sum matrices, sliced once per filter dimension ---
+# Keyed by the dataset version and `source` (the caller's name for the frame) instead of hashing
+# the frame; the matrices are shared read-only
+@st.cache_resource(show_spinner=False)
+def build_migration_flows(_df, data_version, source, origin_col='countryofcitizenship', destination_col='country'):
+    valid = _df.dropna(subset=[origin_col, destination_col, 'finalWorth'])
+    countries = sorted(set(valid[origin_col]) | set(valid[destination_col]))
+    frame = pd.DataFrame({
+        'origin': pd.Categorical(valid[origin_col], categories=countries).codes,
+        'destination': pd.Categorical(valid[destination_col], categories=countries).codes,
+        'worth': valid['finalWorth'].to_numpy(dtype=float),
+    })
+    for dim in FLOW_DIMENSIONS:
+        if dim in valid.columns:
+            values = valid[dim].map(SELF_MADE_LABELS) if dim == 'selfMade' else valid[dim]
+            frame[dim] = values.to_numpy()
+
+    def aggregate(keys):
+        return frame.groupby(keys, observed=True)['worth'].agg(count='size', worth='sum')
+
+    slices = {ALL_OPTION: {ALL_OPTION: _to_sparse(aggregate(['origin', 'destination']))}}
+    for dim in FLOW_DIMENSIONS:
+        if dim not in frame.columns:
+            continue
+        by_value = aggregate([dim, 'origin', 'destination'])
+        slices[dim] = {
+            value: _to_sparse(by_value.xs(value, level=dim))
+            for value in sorted(by_value.index.get_level_values(dim).unique())
+        }
+    return {'countries': countries, 'slices': slices}
+
+
+def get_migration_slice(flows, dimension=ALL_OPTION, value=ALL_OPTION):
+    if dimension == ALL_OPTION:
+        return flows['slices'][ALL_OPTION][ALL_OPTION]
+    return flows['slices'][dimension][value]
+
+
+# --- Sankey of the largest flows in a slice ---
+def plot_migration_sankey(flows, flow_slice, measure='count', movers_only=True, top_n=25):
+    origin, destination = flow_slice['origin'], flow_slice['destination']
+    values = flow_slice[measure]
+    keep = origin != destination if movers_only else np.ones(len(origin), dtype=bool)
+    top = np.flatnonzero(keep)[np.argsort(-values[keep], kind='stable')[:top_n]]
+    if len(top) == 0:
+        return None
+
+    countries = flows['countries']
+    origin_nodes = sorted(set(origin[top]))
+    destination_nodes = sorted(set(destination[top]))
+    origin_pos = {code: i for i, code in enumerate(origin_nodes)}
+    destination_pos = {code: i + len(origin_nodes) for i, code in enumerate(destination_nodes)}
+    labels = [f"{countries[c]} (citizens)" for c in origin_nodes] + [f"{countries[c]} (residents)" for c in destination_nodes]
+    value_format = "%{value:,.0f} billionaires" if measure == 'count' else "$%{value:,.0f}M"
+
+    fig = go.Figure(go.Sankey(
+        arrangement='snap',
+        node=dict(
+            label=labels,
+            pad=12,
+            thickness=14,
+            color=["#51ccd0"] * len(origin_nodes) + ["#fa938d"] * len(destination_nodes),
+            hovertemplate="%{label}<extra></extra>"
+        ),
+        link=dict(
+            source=[origin_pos[c] for c in origin[top]],
+            target=[destination_pos[c] for c in destination[top]],
+            value=values[top],
+            color="rgba(31, 120, 180, 0.25)",
+            hovertemplate="%{source.label} → %{target.label}<br>" + value_format + "<extra></extra>"
+        )
+    ))
+    fig.update_layout(height=600, margin=dict(t=20, b=20, l=10, r=10), paper_bgcolor='rgba(0,0,0,0)')
+    return fig
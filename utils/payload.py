@@ -0,0 +1,128 @@
+import json
+import logging
+import re
+import threading
+
+import numpy as np
+import plotly.io as pio
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHART_BUDGET = 150_000  # bytes of figure JSON per chart
+ROUNDED_KEYS = ('customdata', 'z', 'values', 'r', 'x', 'y', 'lat', 'lon')
+TEMPLATE_KEYS = ('hovertemplate', 'texttemplate')
+_CUSTOMDATA_REF = re.compile(r"%\{customdata\[(\d+)\]")
+
+
+class FigureBudgetExceeded(ValueError):
+    pass
+
+
+# --- Post-processing of figure JSON ---
+def _templates(trace):
+    return ''.join(trace.get(key) or '' for key in TEMPLATE_KEYS)
+
+
+def _rewrite_templates(trace, pattern, replacement):
+    for key in TEMPLATE_KEYS:
+        if trace.get(key):
+            trace[key] = re.sub(pattern, replacement, trace[key])
+
+
+def _round_values(values, decimals):
+    if isinstance(values, float):
+        return round(values, decimals)
+    if isinstance(values, list) and values:
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            if any(isinstance(v, float) for v in values):
+                return np.round(np.asarray(values, dtype=float), decimals).tolist()
+            return values
+        return [_round_values(v, decimals) for v in values]
+    return values
+
+
+def _minimize_trace(trace, decimals, keep_customdata):
+    customdata = trace.get('customdata')
+    if isinstance(customdata, list) and customdata and isinstance(customdata[0], list):
+        columns = list(zip(*customdata))
+        # Columns that repeat the trace's own locations/hovertext are read from there instead
+        aliases = {'location': trace.get('locations')}
+        if '%{hovertext}' in _templates(trace):
+            aliases['hovertext'] = trace.get('hovertext')
+        for i, column in enumerate(columns):
+            if i in keep_customdata:
+                continue
+            for alias, values in aliases.items():
+                if values is not None and list(column) == list(values):
+                    _rewrite_templates(trace, rf"%\{{customdata\[{i}\]", "%{" + alias)
+                    break
+
+        template_text = _templates(trace)
+        if '%{customdata}' in template_text:
+            used = list(range(len(columns)))
+        else:
+            used = sorted({int(i) for i in _CUSTOMDATA_REF.findall(template_text)} | set(keep_customdata))
+        if used:
+            remap = {old: new for new, old in enumerate(used)}
+            _rewrite_templates(trace, _CUSTOMDATA_REF, lambda m: f"%{{customdata[{remap[int(m.group(1))]}]")
+            trace['customdata'] = [[row[i] for i in used] for row in customdata]
+        else:
+            del trace['customdata']
+
+    if trace.get('hovertemplate') and 'hovertext' in trace and '%{hovertext}' not in _templates(trace):
+        del trace['hovertext']
+
+    for key in ROUNDED_KEYS:
+        if key in trace:
+            trace[key] = _round_values(trace[key], decimals)
+
+
+def minimize_figure(fig, decimals=4, keep_customdata=()):
+    # Accepts a go.Figure or a figure dict and returns a new, smaller figure dict
+    if fig is None:
+        return None
+    spec = json.loads(pio.to_json(fig, validate=False))
+    for trace in spec.get('data', []):
+        _minimize_trace(trace, decimals, set(keep_customdata))
+    return spec
+
+
+# --- Byte-size instrumentation ---
+_sizes = {}
+_sizes_lock = threading.Lock()
+
+
+def payload_size(fig):
+    return len(pio.to_json(fig, validate=False).encode('utf-8'))
+
+
+def chart_sizes():
+    with _sizes_lock:
+        return dict(_sizes)
+
+
+def reset_chart_sizes():
+    with _sizes_lock:
+        _sizes.clear()
+
+
+def check_figure_budget(label, size, budget=DEFAULT_CHART_BUDGET):
+    if budget is not None and size > budget:
+        raise FigureBudgetExceeded(f"Chart '{label}' is {size:,} bytes, over its {budget:,} byte budget")
+
+
+def render_plotly_chart(fig, label, budget=DEFAULT_CHART_BUDGET, minimize=True, keep_customdata=(), **kwargs):
+    import streamlit as st
+
+    if fig is not None and minimize:
+        fig = minimize_figure(fig, keep_customdata=keep_customdata)
+    size = payload_size(fig)
+    with _sizes_lock:
+        _sizes[label] = {'bytes': size, 'budget': budget}
+    logger.info("Chart %s: %d bytes", label, size)
+    try:
+        check_figure_budget(label, size, budget)
+    except FigureBudgetExceeded as e:
+        logger.warning("%s", e)
+    return st.plotly_chart(fig, **kwargs)
@@ -0,0 +1,52 @@
+import numpy as np
+import streamlit as st
+
+
+# --- Country x industry profiles and their cosine similarity, built once per dataset version and shared read-only ---
+# pages/04 and Web/radar.py pass different frames; `source` keeps their entries apart
+@st.cache_resource(show_spinner=False)
+def build_country_similarity(_df, data_version, source, country_col='country', industry_col='category'):
+    counts = (
+        _df.dropna(subset=[country_col, industry_col])
+        .groupby([country_col, industry_col])
+        .size()
+        .unstack(fill_value=0)
+    )
+    vectors = counts.to_numpy(dtype=float)
+    totals = vectors.sum(axis=1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit_vectors = vectors / np.where(norms == 0, 1, norms)
+    similarity = unit_vectors @ unit_vectors.T
+    countries = counts.index.tolist()
+    return {
+        'countries': countries,
+        'country_index': {country: i for i, country in enumerate(countries)},
+        'industries': counts.columns.tolist(),
+        'counts': vectors,
+        'shares': vectors / np.where(totals == 0, 1, totals)[:, None],
+        'totals': totals,
+        'similarity': similarity,
+        # Neighbours ranked once, most similar first
+        'ranking': np.argsort(-similarity, axis=1, kind='stable'),
+    }
+
+
+# --- Nearest-neighbour lookup: a row read from the precomputed ranking ---
+def get_similar_countries(similarity_data, country, k=3, min_billionaires=5):
+    i = similarity_data['country_index'].get(country)
+    if i is None:
+        return []
+    neighbours = []
+    for j in similarity_data['ranking'][i]:
+        if j == i or similarity_data['totals'][j] < min_billionaires:
+            continue
+        neighbours.append((similarity_data['countries'][j], float(similarity_data['similarity'][i, j])))
+        if len(neighbours) == k:
+            break
+    return neighbours
+
+
+def get_industry_shares(similarity_data, country, industries):
+    i = similarity_data['country_index'][country]
+    shares = dict(zip(similarity_data['industries'], similarity_data['shares'][i]))
+    return [shares.get(industry, 0.0) * 100 for industry in industries]
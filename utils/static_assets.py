@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from utils.base64_cache import get_base64_cache
+from utils.images import image_mime
+from utils.store import STORE_DIR, logical_name, resolve, store_url
+
+
+# --- Streamlit serves the static/ folder next to the main script, so a Web/ script run on its own serves no store ---
+def store_served():
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    ctx = get_script_run_ctx()
+    if ctx is None or not ctx.main_script_path:
+        return False
+    return Path(ctx.main_script_path).resolve().parent / "static" == STORE_DIR
+
+
+# --- URL of the hashed copy in the asset store, or None so callers can fall back to inlining ---
+def static_url(source):
+    name = logical_name(source)
+    return published_url(name) if name else None
+
+
+def published_url(name):
+    return store_url(name) if store_served() else None
+
+
+# --- File to read for a source path; media published into the store only exists there ---
+def stored_path(source):
+    name = logical_name(source)
+    return (resolve(name) if name else None) or source
+
+
+# --- src for <img>/<video>/CSS: the static URL when published, else an inline data URI ---
+def media_src(path):
+    url = static_url(path)
+    if url is not None:
+        return url
+    encoded = get_base64_cache().encode(stored_path(path))
+    if encoded is None:
+        return None
+    return f"data:{image_mime(path)};base64,{encoded}"
+
+
+# --- Background pool shared by every session, used to pre-encode media a page will likely need next ---
+@st.cache_resource(show_spinner=False)
+def get_prefetch_executor(max_workers=2):
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="media-prefetch")
+
+
+# --- Warm the base64 cache for unpublished files; returns hidden <img> tags so the browser fetches published ones ---
+def prefetch_media(paths):
+    executor = get_prefetch_executor()
+    cache = get_base64_cache()
+    hints = []
+    for path in paths:
+        url = static_url(path)
+        if url is None:
+            executor.submit(cache.encode, stored_path(path))
+        else:
+            hints.append(f'<img src="{url}" alt="" loading="eager" decoding="async" width="1" height="1"/>')
+    if not hints:
+        return ""
+    return '<div style="position:absolute; width:0; height:0; overflow:hidden;" aria-hidden="true">' + "".join(hints) + "</div>"
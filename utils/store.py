@@ -0,0 +1,131 @@
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import streamlit as st
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+STORE_DIR = ROOT_DIR / "static"
+STORE_MANIFEST = ROOT_DIR / "assets" / "manifest.json"
+STORE_URL_PREFIX = "app/static/"
+HASH_LENGTH = 12
+
+
+# --- Content hash of a file, recomputed only when its (path, mtime, size) changes ---
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _hash_file(path, mtime_ns, size):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_hash(path):
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return _hash_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+# --- Manifest: logical name -> {"file", "sha256", "bytes"}, with "file" relative to the repo root ---
+def read_manifest():
+    try:
+        with open(STORE_MANIFEST, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+@st.cache_resource(show_spinner=False)
+def load_manifest(manifest_version):
+    manifest = read_manifest()
+    by_file = {(ROOT_DIR / entry["file"]).resolve(): name for name, entry in manifest.items()}
+    return manifest, by_file
+
+
+def _manifest():
+    try:
+        stat = STORE_MANIFEST.stat()
+    except OSError:
+        return {}, {}
+    return load_manifest(f"{stat.st_mtime_ns:x}-{stat.st_size:x}")
+
+
+# --- Lookups ---
+def logical_name(path):
+    path = Path(path).resolve()
+    name = _manifest()[1].get(path)
+    if name is not None:
+        return name
+    try:
+        return path.relative_to(ROOT_DIR).as_posix()
+    except ValueError:
+        return None
+
+
+def resolve(name):
+    entry = _manifest()[0].get(name)
+    if entry is not None and (ROOT_DIR / entry["file"]).exists():
+        return ROOT_DIR / entry["file"]
+    source = ROOT_DIR / name
+    return source if source.exists() else None
+
+
+def store_url(name):
+    entry = _manifest()[0].get(name)
+    if entry is None:
+        return None
+    path = ROOT_DIR / entry["file"]
+    if path.parent != STORE_DIR or not path.exists():
+        return None
+    return STORE_URL_PREFIX + path.name
+
+
+# --- Build-time helpers used by scripts/build_asset_store.py ---
+def hashed_name(stem, data_hash, suffix):
+    return f"{stem}.{data_hash[:HASH_LENGTH]}{suffix}"
+
+
+def register_file(manifest, name, path):
+    path = Path(path)
+    manifest[name] = {
+        "file": path.resolve().relative_to(ROOT_DIR).as_posix(),
+        "sha256": file_hash(path),
+        "bytes": path.stat().st_size,
+    }
+    return manifest[name]
+
+
+def put_file(manifest, name, source_path):
+    source_path = Path(source_path)
+    target = STORE_DIR / hashed_name(source_path.stem, file_hash(source_path), source_path.suffix)
+    if not target.exists():
+        STORE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source_path, target)
+    return register_file(manifest, name, target)
+
+
+def put_bytes(manifest, name, data):
+    name_path = Path(name)
+    target = STORE_DIR / hashed_name(name_path.stem, hashlib.sha256(data).hexdigest(), name_path.suffix)
+    if not target.exists():
+        STORE_DIR.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    return register_file(manifest, name, target)
+
+
+def write_manifest(manifest):
+    # Blobs no longer referenced by any name are removed from the store
+    referenced = {(ROOT_DIR / entry["file"]).resolve() for entry in manifest.values()}
+    if STORE_DIR.exists():
+        for path in STORE_DIR.iterdir():
+            if path.is_file() and path.resolve() not in referenced:
+                path.unlink()
+    STORE_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    with open(STORE_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
@@ -0,0 +1,60 @@
+import numpy as np
+import streamlit as st
+
+
+DEFAULT_TABLE_COLUMNS = ['rank', 'personName', 'finalWorth', 'age', 'country', 'industries', 'source', 'selfMade', 'gender']
+PAGE_SIZES = (25, 50, 100, 250)
+
+
+# --- Row positions matching the filters, so the mask chain runs once per rerun ---
+def filter_rows(mask):
+    return np.flatnonzero(np.asarray(mask, dtype=bool))
+
+
+# --- Sorted row order over the full dataset, computed once per column and dataset version ---
+# Shared across sessions without copying, so the array is made read-only; `source` names the
+# unhashed frame (pages/03 and Web/dataset.py each load their own)
+@st.cache_resource(show_spinner=False, max_entries=32)
+def sort_order(_df, data_version, source, column, ascending=True):
+    values = _df[column].reset_index(drop=True)
+    order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+    order.flags.writeable = False
+    return order
+
+
+# --- Page of the current selection: walk the sorted order and keep only selected rows ---
+def page_rows(df, rows, data_version, source, column, ascending, page, page_size):
+    order = sort_order(df, data_version, source, column, ascending)
+    selected = np.zeros(len(df), dtype=bool)
+    selected[rows] = True
+    start = (page - 1) * page_size
+    return order[selected[order]][start:start + page_size]
+
+
+# --- Paginated table: only the projected columns of one page are sent to the browser ---
+def render_paginated_table(df, rows, data_version, source, key, default_columns=DEFAULT_TABLE_COLUMNS):
+    columns = list(df.columns)
+    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+    shown_columns = col1.multiselect(
+        "Columns",
+        columns,
+        default=[column for column in default_columns if column in columns],
+        key=f"{key}_columns"
+    )
+    sort_column = col2.selectbox("Sort by", columns, index=columns.index('rank') if 'rank' in columns else 0, key=f"{key}_sort")
+    ascending = col3.selectbox("Order", ["Ascending", "Descending"], key=f"{key}_order") == "Ascending"
+    page_size = col4.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_page_size")
+
+    page_count = max(1, -(-len(rows) // page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > page_count:
+        st.session_state[page_key] = page_count
+    page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key=page_key)
+
+    if not shown_columns:
+        st.info("Select at least one column to display.")
+        return
+    positions = page_rows(df, rows, data_version, source, sort_column, ascending, int(page), page_size)
+    st.dataframe(df.iloc[positions][shown_columns], hide_index=True, use_container_width=True)
+    start = (int(page) - 1) * page_size
+    st.caption(f"Showing rows {min(start + 1, len(rows))}–{start + len(positions)} of {len(rows)}")
@@ -0,0 +1,84 @@
+import pandas as pd
+import streamlit as st
+
+from utils.lazy import px
+
+
+US_STATE_CODES = {
+    "Alabama": "AL", "Alaska": "AK", "Arizona": "AZ", "Arkansas": "AR", "California": "CA",
+    "Colorado": "CO", "Connecticut": "CT", "Delaware": "DE", "District of Columbia": "DC",
+    "Florida": "FL", "Georgia": "GA", "Hawaii": "HI", "Idaho": "ID", "Illinois": "IL",
+    "Indiana": "IN", "Iowa": "IA", "Kansas": "KS", "Kentucky": "KY", "Louisiana": "LA",
+    "Maine": "ME", "Maryland": "MD", "Massachusetts": "MA", "Michigan": "MI", "Minnesota": "MN",
+    "Mississippi": "MS", "Missouri": "MO", "Montana": "MT", "Nebraska": "NE", "Nevada": "NV",
+    "New Hampshire": "NH", "New Jersey": "NJ", "New Mexico": "NM", "New York": "NY",
+    "North Carolina": "NC", "North Dakota": "ND", "Ohio": "OH", "Oklahoma": "OK", "Oregon": "OR",
+    "Pennsylvania": "PA", "Rhode Island": "RI", "South Carolina": "SC", "South Dakota": "SD",
+    "Tennessee": "TN", "Texas": "TX", "Utah": "UT", "Vermont": "VT", "Virginia": "VA",
+    "Washington": "WA", "West Virginia": "WV", "Wisconsin": "WI", "Wyoming": "WY",
+    "Puerto Rico": "PR", "U.S. Virgin Islands": "VI",
+}
+US_COUNTRY_NAMES = ("United States", "United States of America")
+
+
+# --- State and region aggregates, computed once per dataset version and shared read-only ---
+# The raw frame is not hashed; `source` names it in the key
+@st.cache_resource(show_spinner=False)
+def build_us_state_summary(_df, data_version, source, country_col='country', state_col='state', region_col='residencestateregion', worth_col='finalworth'):
+    df = _df
+    empty = pd.DataFrame(columns=['state', 'state_code', 'region', 'billionaire_count', 'total_worth'])
+    if state_col not in df.columns or worth_col not in df.columns:
+        return empty, pd.DataFrame(columns=['region', 'billionaire_count', 'total_worth'])
+
+    us_df = df[df[country_col].isin(US_COUNTRY_NAMES)].dropna(subset=[state_col])
+    if region_col not in us_df.columns:
+        us_df = us_df.assign(**{region_col: "N/A"})
+    state_df = (
+        us_df.groupby(state_col)
+        .agg(
+            region=(region_col, 'first'),
+            billionaire_count=(worth_col, 'size'),
+            total_worth=(worth_col, 'sum'),
+        )
+        .reset_index()
+        .rename(columns={state_col: 'state'})
+    )
+    state_df['state_code'] = state_df['state'].map(US_STATE_CODES)
+    state_df = state_df.dropna(subset=['state_code']).sort_values('billionaire_count', ascending=False)
+
+    region_df = (
+        us_df.dropna(subset=[region_col])
+        .groupby(region_col)
+        .agg(billionaire_count=(worth_col, 'size'), total_worth=(worth_col, 'sum'))
+        .reset_index()
+        .rename(columns={region_col: 'region'})
+        .sort_values('billionaire_count', ascending=False)
+    )
+    return state_df[empty.columns.tolist()], region_df
+
+
+# --- Drill-down figure: one small USA-states choropleth ---
+def create_us_states_map(state_df):
+    if state_df.empty: return None
+    fig = px.choropleth(
+        state_df,
+        locations='state_code', locationmode='USA-states', scope='usa',
+        color='billionaire_count',
+        color_continuous_scale='Blues',
+        custom_data=['state', 'billionaire_count', 'total_worth', 'region'],
+    )
+    fig.update_traces(
+        hovertemplate="<b>%{customdata[0]}</b><br><br>" +
+                      "Billionaires: %{customdata[1]}<br>" +
+                      "Total Net Worth: $%{customdata[2]:,.0f}M<br>" +
+                      "Region: %{customdata[3]}" + "<extra></extra>"
+    )
+    fig.update_layout(
+        title_text=None,
+        height=500,
+        margin={"r":0, "t":10, "l":0, "b":10},
+        dragmode=False,
+        coloraxis_colorbar=dict(title='<b>Billionaires</b>'),
+        geo=dict(showlakes=False, bgcolor='white'),
+    )
+    return fig